@@ -12,6 +12,11 @@ _ = KokoroSynthesizer(device="cpu").pipeline
 PY
 fi
 
+# Bring the API database schema up to date before the server starts.
+if [[ "${EBOOK_TTS_RUN_MIGRATIONS:-0}" == "1" ]]; then
+  alembic upgrade head
+fi
+
 # If first arg starts with `-` or is a known ebook-tts subcommand, prepend ebook-tts.
 # This allows: docker run image --help, docker run image convert ..., etc.
 if [[ $# -gt 0 && ( "${1#-}" != "$1" || "$1" == "convert" || "$1" == "list-voices" ) ]]; then
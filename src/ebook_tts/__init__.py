@@ -1,11 +1,9 @@
 """PDF to Audiobook Converter using Kokoro TTS."""
 
-from .audio_synthesizer import KokoroSynthesizer, MockSynthesizer
-from .audio_writer import SimpleAudioWriter, StreamingAudioWriter
+import importlib
+from typing import TYPE_CHECKING
+
 from .chapter_detector import ChapterDetector
-from .converter import PDFToAudiobook
-from .epub_extractor import EPUBExtractor
-from .pdf_extractor import PDFExtractor
 from .progress import (
     Chapter,
     ChapterMarker,
@@ -21,6 +19,41 @@ from .pronunciation_dict import PronunciationDict, load_dictionary
 from .text_chunker import TextChunker
 from .text_preprocessor import TextPreprocessor
 
+if TYPE_CHECKING:
+    from .audio_synthesizer import KokoroSynthesizer, MockSynthesizer
+    from .audio_writer import SimpleAudioWriter, StreamingAudioWriter
+    from .converter import PDFToAudiobook
+    from .epub_extractor import EPUBExtractor
+    from .pdf_extractor import PDFExtractor
+
+# Components that pull in PyMuPDF, BeautifulSoup, numpy or soundfile are
+# imported on first access, so importing the package (e.g. for the CLI)
+# stays cheap
+_LAZY_IMPORTS = {
+    "KokoroSynthesizer": ".audio_synthesizer",
+    "MockSynthesizer": ".audio_synthesizer",
+    "SimpleAudioWriter": ".audio_writer",
+    "StreamingAudioWriter": ".audio_writer",
+    "PDFToAudiobook": ".converter",
+    "EPUBExtractor": ".epub_extractor",
+    "PDFExtractor": ".pdf_extractor",
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported components on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not yet imported components."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __version__ = "1.0.0"
 __all__ = [
     # Main converter
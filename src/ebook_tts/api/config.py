@@ -1,6 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
 from functools import lru_cache
+from typing import NamedTuple
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +14,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # App
@@ -41,18 +43,27 @@ class Settings(BaseSettings):
     download_url_expire_seconds: int = 86400  # 24 hours
 
     # Worker settings
-    max_concurrent_jobs: int = 1  # Limited RAM on free tier
+    max_concurrent_jobs: int = 2  # Jobs share one model via the synthesis batcher
+    max_concurrent_previews: int = 4  # Chapter/text previews parsed at once
+    progress_update_interval: float = 0.5  # Min seconds between progress writes
     job_timeout_seconds: int = 3600  # 1 hour max per job
     cleanup_after_days: int = 7  # Delete old jobs/files after this many days
 
     # TTS settings
     tts_device: str = "cuda"  # Use GPU locally; set to "cpu" for Fly.io
+    tts_precision: str = "fp32"  # fp16/bf16 on GPU, int8 on CPU (fp32 = full)
+    warmup_model: bool = True  # Load the default voice's model at startup
     default_voice: str = "af_heart"
     default_chunk_size: int = 2000
+    synthesis_batch_size: int = 0  # Max chunks per cross-job batch (0 = max_concurrent_jobs)
+    synthesis_batch_wait_ms: int = 20  # Max wait for a batch to fill up
 
     # Local storage (for testing without S3)
     use_local_storage: bool = False  # Set to True for local dev without S3
     local_storage_path: str = "./data/uploads"
+    # Internal nginx location aliased to local_storage_path (e.g. "/internal-local/").
+    # When set, downloads are handed to nginx via X-Accel-Redirect.
+    local_storage_accel_prefix: str = ""
 
     @property
     def s3_configured(self) -> bool:
@@ -68,3 +79,17 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+class JwtConfig(NamedTuple):
+    """JWT signing parameters, resolved once from settings."""
+
+    secret_key: str
+    algorithm: str
+
+
+@lru_cache
+def get_jwt_config() -> JwtConfig:
+    """Get cached JWT signing parameters."""
+    settings = get_settings()
+    return JwtConfig(settings.jwt_secret_key, settings.jwt_algorithm)
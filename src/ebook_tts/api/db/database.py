@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from ..config import get_settings
@@ -25,8 +25,25 @@ engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
     echo=settings.debug,
+    query_cache_size=1200,  # Keep compiled job/user queries across requests
 )
 
+if settings.database_url.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """Tune each new SQLite connection for concurrent reads and writes."""
+        cursor = dbapi_conn.cursor()
+        # WAL lets progress polling read while the worker writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # Durable across app crashes in WAL mode; only fsyncs at checkpoints
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        # Wait for locks instead of failing with "database is locked"
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -0,0 +1,31 @@
+"""Extend jobs user/created index with id
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 04:12:51.203417
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_jobs_user_created", table_name="jobs")
+    op.create_index(
+        "ix_jobs_user_created",
+        "jobs",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_user_created", table_name="jobs")
+    op.create_index("ix_jobs_user_created", "jobs", ["user_id", sa.text("created_at DESC")])
@@ -1,18 +1,23 @@
 """SQLAlchemy ORM models for the API database."""
 
 import enum
+import os
+import time
+import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
-    Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    literal_column,
 )
 from sqlalchemy.orm import relationship
 
@@ -34,6 +39,21 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def uuid7() -> str:
+    """
+    Return a time-ordered UUIDv7 string (RFC 9562) for use as a primary key.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right edge of the primary-key index instead of splitting pages
+    all over it. The remaining 74 bits (after version/variant) are random.
+    """
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
 class User(Base):
     """User account model."""
 
@@ -74,7 +94,7 @@ class Job(Base):
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
-    status = Column(Enum(JobStatus), default=JobStatus.PENDING, index=True)
+    status = Column(String(16), default=JobStatus.PENDING.value, index=True)
 
     # Input file info
     input_filename = Column(String(255), nullable=False)
@@ -93,6 +113,16 @@ class Job(Base):
     current_chunk = Column(Integer, default=0)
     total_chunks = Column(Integer, default=0)
     message = Column(Text)
+    # "host:pid:token" of the API process that claimed the job
+    worker_id = Column(String(255))
+    # Bumped by every UPDATE so watchers can detect any change with one compare
+    version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        onupdate=literal_column("version + 1"),
+    )
 
     # Output info
     output_s3_key = Column(String(512))
@@ -109,3 +139,16 @@ class Job(Base):
 
     # Relationships
     user = relationship("User", back_populates="jobs")
+
+    __table_args__ = (
+        # Serves list_jobs (filter by user, newest first, id as tie-breaker for
+        # keyset pages) without a sort step; the leading user_id column also
+        # covers plain per-user lookups
+        Index("ix_jobs_user_created", "user_id", created_at.desc(), id.desc()),
+        # Plain string column instead of Enum: no native ENUM type to migrate
+        # on Postgres and no enum coercion when hydrating rows
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s.value}'" for s in JobStatus)),
+            name="ck_jobs_status",
+        ),
+    )
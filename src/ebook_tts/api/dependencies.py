@@ -1,17 +1,41 @@
 """FastAPI dependency injection functions."""
 
+import threading
+import time
 from typing import Generator
 
+import jwt
+from cachetools import TLRUCache, TTLCache
 from fastapi import Cookie, Depends, Header, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jwt import InvalidTokenError
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from .config import Settings, get_settings
+from .config import JwtConfig, get_jwt_config
 from .db.database import SessionLocal
 from .db.models import User
 
 security = HTTPBearer()
+security_optional = HTTPBearer(auto_error=False)
+
+# Column snapshots of recently authenticated users, keyed by user ID.
+# ORM instances can't be shared across sessions, so each hit rebuilds a
+# User from the snapshot and attaches it to the request's session.
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+# Verified JWT payloads keyed by (token, secret, algorithm). Each entry
+# expires at the token's own "exp" claim, so a cached payload is never
+# served for a token that jwt.decode would reject as expired.
+_token_cache: TLRUCache = TLRUCache(
+    maxsize=4096,
+    ttu=lambda _key, payload, now: payload.get("exp", now),
+    timer=time.time,
+)
+_token_cache_lock = threading.Lock()
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -23,10 +47,75 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _decode_token(token: str, jwt_config: JwtConfig) -> dict:
+    """
+    Verify and decode a JWT, caching the payload until the token expires.
+
+    Raises InvalidTokenError if the token is invalid or expired.
+    """
+    key = (token, jwt_config)
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is None:
+        payload = jwt.decode(
+            token,
+            jwt_config.secret_key,
+            algorithms=[jwt_config.algorithm],
+        )
+        with _token_cache_lock:
+            _token_cache[key] = payload
+    return payload
+
+
+def _load_user(db: Session, user_id: str) -> User | None:
+    """
+    Load a user by ID, serving repeat lookups from the TTL cache.
+
+    A cached user can be up to USER_CACHE_TTL_SECONDS old. Code that changes
+    a user row must call invalidate_user() afterwards; changes made outside
+    the API (e.g. deactivating an account in the database) take effect once
+    the snapshot expires.
+    """
+    with _user_cache_lock:
+        snapshot = _user_cache.get(user_id)
+
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.get(User, user_id)
+    if user is not None:
+        snapshot = {key: getattr(user, key) for key in _USER_COLUMNS}
+        with _user_cache_lock:
+            _user_cache[user_id] = snapshot
+    return user
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a user from the cache so the next request reloads it."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def _resolve_token(
+    token: str | None,
+    access_token: str | None,
+    authorization: str | None,
+) -> str | None:
+    """Pick the JWT from query param, cookie or Bearer header, in that order."""
+    if token or access_token:
+        return token or access_token
+    if authorization and authorization[:7] == "Bearer ":
+        return authorization[7:]
+    return None
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    jwt_config: JwtConfig = Depends(get_jwt_config),
 ) -> User:
     """
     Dependency that validates JWT and returns the current user.
@@ -40,21 +129,17 @@ def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = _decode_token(credentials.credentials, jwt_config)
         user_id: str = payload.get("sub")
         token_type: str = payload.get("type")
 
         if user_id is None or token_type != "access":
             raise credentials_exception
 
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception from None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
@@ -68,11 +153,9 @@ def get_current_user(
 
 
 def get_current_user_optional(
-    credentials: HTTPAuthorizationCredentials | None = Depends(
-        HTTPBearer(auto_error=False)
-    ),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_optional),
     db: Session = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    jwt_config: JwtConfig = Depends(get_jwt_config),
 ) -> User | None:
     """
     Optional authentication - returns user if valid token, None otherwise.
@@ -83,22 +166,18 @@ def get_current_user_optional(
         return None
 
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = _decode_token(credentials.credentials, jwt_config)
         user_id: str = payload.get("sub")
         token_type: str = payload.get("type")
 
         if user_id is None or token_type != "access":
             return None
 
-        user = db.query(User).filter(User.id == user_id).first()
+        user = _load_user(db, user_id)
         if user and user.is_active:
             return user
 
-    except JWTError:
+    except InvalidTokenError:
         pass
 
     return None
@@ -109,7 +188,7 @@ def get_current_user_flexible(
     access_token: str | None = Cookie(None),
     authorization: str | None = Header(None),
     db: Session = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    jwt_config: JwtConfig = Depends(get_jwt_config),
 ) -> User:
     """
     Flexible authentication for SSE endpoints.
@@ -119,11 +198,7 @@ def get_current_user_flexible(
     - Cookie: access_token=<jwt>
     - Header: Authorization: Bearer <jwt>
     """
-    # Try to extract token from available sources
-    jwt_token = token or access_token
-    if not jwt_token and authorization and authorization.startswith("Bearer "):
-        jwt_token = authorization.split(" ", 1)[1]
-
+    jwt_token = _resolve_token(token, access_token, authorization)
     if not jwt_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -138,21 +213,17 @@ def get_current_user_flexible(
     )
 
     try:
-        payload = jwt.decode(
-            jwt_token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = _decode_token(jwt_token, jwt_config)
         user_id: str = payload.get("sub")
         token_type: str = payload.get("type")
 
         if user_id is None or token_type != "access":
             raise credentials_exception
 
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception from None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
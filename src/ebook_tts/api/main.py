@@ -6,10 +6,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 from .config import get_settings
-from .db.database import Base, engine
+from .db.database import engine
 from .routers import auth, convert, preview, voices
+from .services.synthesis_service import get_synthesis_batcher
+from .services.worker_service import get_job_queue
 
 # Configure logging
 logging.basicConfig(
@@ -19,18 +22,46 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _log_warmup_result(future) -> None:
+    """Log the outcome of the background model warmup."""
+    error = future.exception()
+    if error is None:
+        logger.info("TTS model warmed up")
+    else:
+        logger.warning(f"TTS model warmup failed: {error}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
-    # Startup: Create database tables
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created")
+    settings = get_settings()
+
+    # Startup: Check the database is reachable. The schema is managed by
+    # Alembic (`alembic upgrade head`), not created here.
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    logger.info("Database connection OK")
+
+    # Warm the TTS model in the background so the first job doesn't pay for it
+    if settings.warmup_model:
+        logger.info(f"Warming up TTS model ({settings.default_voice})...")
+        get_synthesis_batcher().warmup(settings.default_voice).add_done_callback(
+            _log_warmup_result
+        )
+
+    # Start the persistent job workers and pick up jobs left pending or
+    # interrupted by the previous process
+    job_queue = get_job_queue()
+    job_queue.start()
+    requeued = job_queue.requeue_pending()
+    if requeued:
+        logger.info(f"Re-queued {requeued} pending job(s)")
 
     yield
 
-    # Shutdown: cleanup if needed
+    # Shutdown: let workers exit without waiting on in-flight conversions
     logger.info("Shutting down...")
+    job_queue.stop(timeout=0)
 
 
 def create_app() -> FastAPI:
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from ..db.models import User
-from ..dependencies import get_current_user, get_db
+from ..dependencies import get_current_user, get_db, invalidate_user
 from ..models.user import (
     TokenRefresh,
     TokenResponse,
@@ -83,6 +83,7 @@ def logout(
     """
     auth_service = AuthService(db)
     auth_service.logout(token_data.refresh_token)
+    invalidate_user(current_user.id)
 
 
 @router.get(
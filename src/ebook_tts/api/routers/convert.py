@@ -2,101 +2,119 @@
 
 import asyncio
 import json
-import time
-from pathlib import Path
+import os
+import stat
 from typing import AsyncGenerator
+from urllib.parse import quote
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ..config import get_settings
 from ..db.models import Job, JobStatus, User
 from ..dependencies import get_current_user, get_current_user_flexible, get_db
 from ..models.job import JobCreate, JobResponse, UploadResponse
+from ..services.event_service import get_job_event_bus
 from ..services.job_service import JobService
 from ..services.storage_service import StorageService, get_storage_service
-from ..services.worker_service import WorkerService
+from ..services.worker_service import JobQueue, get_job_queue
 
 router = APIRouter(prefix="/convert", tags=["Conversion"])
 
+ALLOWED_UPLOAD_EXTENSIONS = frozenset({".pdf", ".epub"})
+
 
 # === SSE Helper Functions ===
 
 
-def _format_sse(data: dict, event: str = "message") -> str:
-    """Format data as a Server-Sent Event."""
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+def _format_sse(data: dict, event: str = "message") -> bytes:
+    """Format data as a Server-Sent Event, ready to write to the response."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
 
 
 async def _job_events_generator(
     job_id: str,
     user_id: str,
     db: Session,
-    poll_interval: float = 0.5,
     heartbeat_interval: float = 15.0,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Async generator that yields SSE events for job progress.
 
-    Polls the database for changes and yields events when progress updates.
-    Sends heartbeat comments to keep the connection alive.
+    Waits on the job event bus and re-reads the job only when it has been
+    updated. If nothing has been sent for a heartbeat interval the job is
+    re-read anyway (covering updates made by another process) and a
+    heartbeat comment keeps the connection alive.
     Terminates when job reaches a terminal state.
     """
-    last_state = None
-    last_heartbeat = time.time()
-
-    while True:
-        # Refresh session to get latest data
-        db.expire_all()
-
-        job = db.query(Job).filter(Job.id == job_id, Job.user_id == user_id).first()
-        if not job:
-            yield _format_sse({"error": "Job not found"}, event="error")
-            return
-
-        # Check if state changed
-        current_state = (
-            job.status,
-            job.stage,
-            job.progress_percent,
-            job.current_chunk,
-            job.message,
-        )
-
-        if current_state != last_state:
-            yield _format_sse(
-                {
-                    "status": job.status.value if job.status else None,
-                    "stage": job.stage,
-                    "progress_percent": job.progress_percent,
-                    "current_chunk": job.current_chunk,
-                    "total_chunks": job.total_chunks,
-                    "message": job.message,
-                },
-                event="progress",
-            )
-            last_state = current_state
-            last_heartbeat = time.time()
-
-        # Check for terminal state
-        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            # Send done event with final info
-            done_data = {"status": job.status.value}
-            if job.status == JobStatus.COMPLETED:
-                done_data["duration_seconds"] = job.duration_seconds
-                done_data["chapters_count"] = job.chapters_count
-            elif job.status == JobStatus.FAILED:
-                done_data["error_message"] = job.error_message
-            yield _format_sse(done_data, event="done")
-            return
-
-        # Send heartbeat if no updates for a while
-        if time.time() - last_heartbeat > heartbeat_interval:
-            yield ": heartbeat\n\n"
-            last_heartbeat = time.time()
-
-        await asyncio.sleep(poll_interval)
+    last_version = None
+    loop = asyncio.get_running_loop()
+    next_heartbeat = loop.time() + heartbeat_interval
+
+    # Read only the columns sent to the client. Plain rows bypass the
+    # identity map, so every read sees the latest committed values.
+    query = select(
+        Job.version,
+        Job.status,
+        Job.stage,
+        Job.progress_percent,
+        Job.current_chunk,
+        Job.total_chunks,
+        Job.message,
+        Job.error_message,
+        Job.duration_seconds,
+        Job.chapters_count,
+    ).where(Job.id == job_id, Job.user_id == user_id)
+
+    with get_job_event_bus().subscribe(job_id) as changed:
+        while True:
+            # Clear before reading so an update committed mid-read isn't missed
+            changed.clear()
+
+            job = db.execute(query).first()
+            if not job:
+                yield _format_sse({"error": "Job not found"}, event="error")
+                return
+
+            # Every UPDATE bumps the row version, so any change shows up here
+            if job.version != last_version:
+                yield _format_sse(
+                    {
+                        "status": job.status,
+                        "stage": job.stage,
+                        "progress_percent": job.progress_percent,
+                        "current_chunk": job.current_chunk,
+                        "total_chunks": job.total_chunks,
+                        "message": job.message,
+                    },
+                    event="progress",
+                )
+                last_version = job.version
+                next_heartbeat = loop.time() + heartbeat_interval
+
+            # Check for terminal state
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                # Send done event with final info
+                done_data = {"status": job.status}
+                if job.status == JobStatus.COMPLETED:
+                    done_data["duration_seconds"] = job.duration_seconds
+                    done_data["chapters_count"] = job.chapters_count
+                elif job.status == JobStatus.FAILED:
+                    done_data["error_message"] = job.error_message
+                yield _format_sse(done_data, event="done")
+                return
+
+            # Wait for the next update; send a heartbeat if the stream has
+            # been quiet until the (monotonic) deadline
+            try:
+                await asyncio.wait_for(
+                    changed.wait(), timeout=max(0.0, next_heartbeat - loop.time())
+                )
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                next_heartbeat = loop.time() + heartbeat_interval
 
 
 @router.get(
@@ -118,8 +136,8 @@ def get_upload_url(
     Save the `upload_key` to use when creating a conversion job.
     """
     # Validate filename extension
-    lower_filename = filename.lower()
-    if not (lower_filename.endswith(".pdf") or lower_filename.endswith(".epub")):
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in ALLOWED_UPLOAD_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF and EPUB files are supported",
@@ -137,10 +155,10 @@ def get_upload_url(
 def create_conversion_job(
     upload_key: str,
     job_settings: JobCreate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     storage: StorageService = Depends(get_storage_service),
+    job_queue: JobQueue = Depends(get_job_queue),
 ):
     """
     Start a new ebook-to-audiobook conversion job.
@@ -173,8 +191,8 @@ def create_conversion_job(
         settings=job_settings,
     )
 
-    # Queue background processing
-    background_tasks.add_task(WorkerService.process_job, job.id)
+    # Hand off to the persistent worker pool
+    job_queue.enqueue(job.id)
 
     return job
 
@@ -187,19 +205,54 @@ def create_conversion_job(
 def list_jobs(
     limit: int = Query(default=20, le=100, description="Maximum number of jobs"),
     offset: int = Query(default=0, ge=0, description="Number of jobs to skip"),
+    after: str | None = Query(
+        default=None,
+        description="ID of the last job on the previous page (keyset pagination)",
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     storage: StorageService = Depends(get_storage_service),
 ):
-    """List the current user's conversion jobs, newest first."""
+    """
+    List the current user's conversion jobs, newest first.
+
+    To page through jobs, pass the `id` of the last job received as `after`;
+    this stays fast however deep the page, unlike a growing `offset`.
+    """
     job_service = JobService(db, storage)
     return job_service.list_jobs(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
+        after=after,
     )
 
 
+@router.get(
+    "/jobs/batch",
+    response_model=list[JobResponse],
+    summary="Get status of several jobs",
+)
+def get_jobs_status(
+    ids: list[str] = Query(
+        ...,
+        max_length=100,
+        description="Job IDs to fetch (repeat the parameter: ?ids=a&ids=b)",
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    storage: StorageService = Depends(get_storage_service),
+):
+    """
+    Get the status and progress of several conversion jobs at once.
+
+    Use this to poll a dashboard of jobs in one request instead of one
+    request per job. Unknown IDs are omitted from the result.
+    """
+    job_service = JobService(db, storage)
+    return job_service.get_jobs(ids, current_user.id)
+
+
 @router.get(
     "/jobs/{job_id}",
     response_model=JobResponse,
@@ -364,8 +417,8 @@ async def upload_local(
             detail="Local upload not available. Use S3 pre-signed URL instead.",
         )
 
-    content = await file.read()
-    storage.save_upload(upload_key, content)
+    # Stream from the spooled upload in chunks, off the event loop
+    await run_in_threadpool(storage.save_upload_stream, upload_key, file.file)
     return {"status": "uploaded", "key": upload_key}
 
 
@@ -387,13 +440,32 @@ def download_local(
             detail="Local download not available. Use S3 pre-signed URL instead.",
         )
 
-    settings = get_settings()
-    file_path = Path(settings.local_storage_path) / file_key
+    file_path = storage.local_path(file_key)
+
+    # Stat once and hand the result to FileResponse so it doesn't stat again
+    try:
+        stat_result = file_path.stat()
+    except OSError:
+        stat_result = None
 
-    if not file_path.exists():
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
         )
 
-    return FileResponse(file_path, filename=file_path.name)
+    # Behind nginx, let it send the file with sendfile(2) instead of
+    # copying it through the app. The location must be `internal` and
+    # alias local_storage_path.
+    accel_prefix = storage.settings.local_storage_accel_prefix
+    if accel_prefix:
+        return Response(
+            headers={
+                "X-Accel-Redirect": accel_prefix + quote(file_key),
+                "Content-Disposition": (
+                    f"attachment; filename*=utf-8''{quote(file_path.name)}"
+                ),
+            },
+        )
+
+    return FileResponse(file_path, filename=file_path.name, stat_result=stat_result)
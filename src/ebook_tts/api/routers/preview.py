@@ -1,7 +1,12 @@
 """Preview router for chapter detection and text preview."""
 
+import threading
+from functools import partial
+
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from ..config import get_settings
 from ..db.models import User
 from ..dependencies import get_current_user
 from ..models.voice import ChapterInfo, ChaptersResponse, PreviewResponse
@@ -9,13 +14,35 @@ from ..services.storage_service import StorageService, get_storage_service
 
 router = APIRouter(prefix="/preview", tags=["Preview"])
 
+# Previews download and parse whole ebooks. Run them on their own bounded
+# set of worker threads so a burst can't starve the shared threadpool
+# that serves auth and job routes.
+_preview_limiter = anyio.CapacityLimiter(get_settings().max_concurrent_previews)
+
+# Preview converters carry per-call state (selected extractor, detected
+# language), so each preview thread keeps and reuses its own
+_thread_state = threading.local()
+
+
+def _preview_converter():
+    """Get the calling thread's mock-TTS converter, creating it on first use."""
+    converter = getattr(_thread_state, "converter", None)
+    if converter is None:
+        # Import here to avoid loading TTS model at module import
+        from ...converter import PDFToAudiobook
+
+        # Use mock TTS to avoid loading the model
+        converter = PDFToAudiobook(mock_tts=True, device="cpu")
+        _thread_state.converter = converter
+    return converter
+
 
 @router.post(
     "/chapters",
     response_model=ChaptersResponse,
     summary="Detect chapters",
 )
-def detect_chapters(
+async def detect_chapters(
     upload_key: str,
     current_user: User = Depends(get_current_user),
     storage: StorageService = Depends(get_storage_service),
@@ -26,6 +53,14 @@ def detect_chapters(
     Use this after uploading a file to see what chapters are available.
     You can then specify which chapters to convert when creating a job.
     """
+    return await anyio.to_thread.run_sync(
+        partial(_detect_chapters, storage, upload_key),
+        limiter=_preview_limiter,
+    )
+
+
+def _detect_chapters(storage: StorageService, upload_key: str) -> ChaptersResponse:
+    """Download an upload and detect its chapters (blocking)."""
     # Verify file exists
     if not storage.file_exists(upload_key):
         raise HTTPException(
@@ -37,11 +72,7 @@ def detect_chapters(
     local_path = storage.download_to_temp(upload_key)
 
     try:
-        # Import here to avoid loading TTS model at module import
-        from ...converter import PDFToAudiobook
-
-        # Use mock TTS to avoid loading the model
-        converter = PDFToAudiobook(mock_tts=True, device="cpu")
+        converter = _preview_converter()
         chapters = converter.extract_chapters(str(local_path))
 
         return ChaptersResponse(
@@ -67,7 +98,7 @@ def detect_chapters(
     response_model=PreviewResponse,
     summary="Preview processed text",
 )
-def preview_text(
+async def preview_text(
     upload_key: str,
     max_chars: int = Query(
         default=1000,
@@ -87,6 +118,16 @@ def preview_text(
     - Abbreviation expansion
     - Language detection
     """
+    return await anyio.to_thread.run_sync(
+        partial(_preview_text, storage, upload_key, max_chars),
+        limiter=_preview_limiter,
+    )
+
+
+def _preview_text(
+    storage: StorageService, upload_key: str, max_chars: int
+) -> PreviewResponse:
+    """Download an upload and preprocess the start of its text (blocking)."""
     # Verify file exists
     if not storage.file_exists(upload_key):
         raise HTTPException(
@@ -98,11 +139,7 @@ def preview_text(
     local_path = storage.download_to_temp(upload_key)
 
     try:
-        # Import here to avoid loading TTS model at module import
-        from ...converter import PDFToAudiobook
-
-        # Use mock TTS to avoid loading the model
-        converter = PDFToAudiobook(mock_tts=True, device="cpu")
+        converter = _preview_converter()
 
         # Get preprocessed text
         text = converter.preview_text(str(local_path), max_chars=max_chars)
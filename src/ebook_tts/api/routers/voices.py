@@ -20,6 +20,41 @@ LANGUAGE_NAMES = {
 }
 
 
+def _build_voice_list(language: str | None = None) -> VoiceListResponse:
+    """Build the voice listing, optionally filtered to one language."""
+    voices = []
+    by_language: dict[str, list[VoiceInfo]] = {}
+
+    for voice_name, (lang_code, description) in KOKORO_VOICES.items():
+        # Filter by language if specified
+        if language and lang_code != language:
+            continue
+
+        voice_info = VoiceInfo(
+            name=voice_name,
+            description=description,
+            language_code=lang_code,
+            language_name=LANGUAGE_NAMES.get(lang_code, lang_code),
+        )
+        voices.append(voice_info)
+
+        if lang_code not in by_language:
+            by_language[lang_code] = []
+        by_language[lang_code].append(voice_info)
+
+    return VoiceListResponse(voices=voices, by_language=by_language)
+
+
+# The voice catalog is fixed for the life of the process, so every
+# response is built once at import
+_ALL_VOICES = _build_voice_list()
+_VOICES_BY_LANGUAGE = {
+    lang_code: _build_voice_list(lang_code)
+    for lang_code in {lang for lang, _ in KOKORO_VOICES.values()}
+}
+_NO_VOICES = VoiceListResponse(voices=[], by_language={})
+
+
 @router.get(
     "/",
     response_model=VoiceListResponse,
@@ -44,24 +79,6 @@ def list_voices(
     - `bf_emma`: British English Female - Emma
     - `am_adam`: American English Male - Adam
     """
-    voices = []
-    by_language: dict[str, list[VoiceInfo]] = {}
-
-    for voice_name, (lang_code, description) in KOKORO_VOICES.items():
-        # Filter by language if specified
-        if language and lang_code != language:
-            continue
-
-        voice_info = VoiceInfo(
-            name=voice_name,
-            description=description,
-            language_code=lang_code,
-            language_name=LANGUAGE_NAMES.get(lang_code, lang_code),
-        )
-        voices.append(voice_info)
-
-        if lang_code not in by_language:
-            by_language[lang_code] = []
-        by_language[lang_code].append(voice_info)
-
-    return VoiceListResponse(voices=voices, by_language=by_language)
+    if language:
+        return _VOICES_BY_LANGUAGE.get(language, _NO_VOICES)
+    return _ALL_VOICES
@@ -1,19 +1,53 @@
 """Authentication service for JWT and password handling."""
 
 import hashlib
+import os
+import threading
 import uuid
 from datetime import datetime, timedelta, timezone
 
+import jwt
 from fastapi import HTTPException, status
-from jose import jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from ..config import Settings, get_settings
-from ..db.models import RefreshToken, User
+from ..db.models import RefreshToken, User, utcnow, uuid7
+from ..dependencies import invalidate_user
 from ..models.user import TokenResponse, UserCreate, UserLogin, UserResponse
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id (OWASP baseline: 19 MiB, 2 passes, 1 lane).
+# bcrypt hashes still verify and are re-hashed on the user's next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+# argon2 and bcrypt release the GIL, so the threadpool already hashes in
+# parallel. Cap concurrent hashes at the core count: extra threads only
+# add contention, and each argon2 hash holds 19 MiB while it runs.
+_password_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+
+def _hash_password(password: str) -> str:
+    """Hash a new password."""
+    with _password_slots:
+        return pwd_context.hash(password)
+
+
+def _verify_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify a password, returning a replacement hash if it's outdated."""
+    with _password_slots:
+        return pwd_context.verify_and_update(password, hashed)
+
+
+def _hash_token(token: str) -> str:
+    """Hash a refresh token for storage and lookup."""
+    # hashlib's sha256 is OpenSSL-backed and uses SHA-NI where the CPU has it
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 class AuthService:
@@ -37,15 +71,20 @@ class AuthService:
             )
 
         user = User(
-            id=str(uuid.uuid4()),
+            id=uuid7(),
             email=user_data.email,
-            hashed_password=pwd_context.hash(user_data.password),
+            hashed_password=_hash_password(user_data.password),
+            # Naive UTC, as the column stores it and reads return it
+            created_at=utcnow().replace(tzinfo=None),
         )
         self.db.add(user)
+        # Flushing fills in the column defaults; build the response before
+        # committing so it doesn't need a reload of the expired row
+        self.db.flush()
+        response = UserResponse.model_validate(user)
         self.db.commit()
-        self.db.refresh(user)
 
-        return UserResponse.model_validate(user)
+        return response
 
     def login(self, credentials: UserLogin) -> TokenResponse:
         """
@@ -55,19 +94,32 @@ class AuthService:
         """
         user = self.db.query(User).filter(User.email == credentials.email).first()
 
-        if not user or not pwd_context.verify(credentials.password, user.hashed_password):
+        valid, new_hash = (
+            _verify_password(credentials.password, user.hashed_password)
+            if user
+            else (False, None)
+        )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
             )
 
+        # Upgrade legacy (bcrypt) or outdated hashes while we have the password
+        if new_hash:
+            user.hashed_password = new_hash
+
         if not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is disabled",
             )
 
-        return self._create_tokens(user)
+        tokens = self._create_tokens(user)
+        if new_hash:
+            # The new hash was committed with the tokens
+            invalidate_user(user.id)
+        return tokens
 
     def refresh(self, refresh_token: str) -> TokenResponse:
         """
@@ -75,10 +127,11 @@ class AuthService:
 
         Raises HTTPException 401 if refresh token is invalid or expired.
         """
-        token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+        token_hash = _hash_token(refresh_token)
 
         stored_token = (
             self.db.query(RefreshToken)
+            .options(joinedload(RefreshToken.user))
             .filter(
                 RefreshToken.token_hash == token_hash,
                 RefreshToken.expires_at > datetime.now(timezone.utc),
@@ -94,15 +147,15 @@ class AuthService:
 
         user = stored_token.user
 
-        # Delete old refresh token (rotation)
+        # Delete old refresh token (rotation); committed together with the
+        # new token in _create_tokens
         self.db.delete(stored_token)
-        self.db.commit()
 
         return self._create_tokens(user)
 
     def logout(self, refresh_token: str) -> None:
         """Invalidate a refresh token."""
-        token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+        token_hash = _hash_token(refresh_token)
         self.db.query(RefreshToken).filter(
             RefreshToken.token_hash == token_hash
         ).delete()
@@ -124,9 +177,9 @@ class AuthService:
         )
 
         stored_refresh = RefreshToken(
-            id=str(uuid.uuid4()),
+            id=uuid7(),
             user_id=user.id,
-            token_hash=hashlib.sha256(refresh_token.encode()).hexdigest(),
+            token_hash=_hash_token(refresh_token),
             expires_at=refresh_expires,
         )
         self.db.add(stored_refresh)
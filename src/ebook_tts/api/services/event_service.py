@@ -0,0 +1,63 @@
+"""In-process notifications for job state changes."""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class JobEventBus:
+    """
+    Wake SSE streams when a job changes instead of having them poll.
+
+    Job updates are committed by JobService, either on a JobQueue worker
+    thread or in a request handler. After each commit the job ID is
+    published here, and every stream subscribed to that job has its event
+    set on its own event loop.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self, job_id: str) -> Iterator[asyncio.Event]:
+        """
+        Subscribe the running event loop to changes of a job.
+
+        Yields:
+            Event that is set whenever the job is updated; the caller
+            clears it before re-reading the job
+        """
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[job_id]
+
+    def publish(self, job_id: str) -> None:
+        """Notify subscribers that a job was updated. Safe from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+
+        for loop, event in subscribers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Subscriber's loop has already shut down
+                pass
+
+
+_job_event_bus = JobEventBus()
+
+
+def get_job_event_bus() -> JobEventBus:
+    """Get the process-wide job event bus."""
+    return _job_event_bus
@@ -1,18 +1,42 @@
 """Job management service for conversion jobs."""
 
 import json
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.orm import Session, load_only
 
-from ..db.models import Job, JobStatus
+from ..db.models import Job, JobStatus, uuid7
 from ..models.job import JobCreate, JobProgress, JobResponse
+from .event_service import get_job_event_bus
 from .storage_service import StorageService
 
+# Columns read by JobService._to_response; job reads that only build a
+# response skip the input/settings columns the worker needs
+_RESPONSE_COLUMNS = load_only(
+    Job.id,
+    Job.status,
+    Job.input_filename,
+    Job.voice,
+    Job.speed,
+    Job.output_format,
+    Job.stage,
+    Job.progress_percent,
+    Job.current_chunk,
+    Job.total_chunks,
+    Job.message,
+    Job.output_s3_key,
+    Job.duration_seconds,
+    Job.chapters_count,
+    Job.created_at,
+    Job.started_at,
+    Job.completed_at,
+    Job.error_message,
+)
+
 
 class JobService:
     """Service for managing conversion jobs."""
@@ -40,9 +64,9 @@ class JobService:
         input_format = Path(filename).suffix.lower().lstrip(".")
 
         job = Job(
-            id=str(uuid.uuid4()),
+            id=uuid7(),
             user_id=user_id,
-            status=JobStatus.PENDING,
+            status=JobStatus.PENDING.value,
             input_filename=filename,
             input_s3_key=upload_key,
             input_format=input_format,
@@ -70,6 +94,7 @@ class JobService:
         """
         job = (
             self.db.query(Job)
+            .options(_RESPONSE_COLUMNS)
             .filter(Job.id == job_id, Job.user_id == user_id)
             .first()
         )
@@ -79,22 +104,72 @@ class JobService:
 
         return self._to_response(job)
 
+    def get_jobs(self, job_ids: list[str], user_id: str) -> list[JobResponse]:
+        """
+        Get several jobs by ID in one query, newest first.
+
+        IDs that don't exist or belong to another user are left out.
+        """
+        if not job_ids:
+            return []
+
+        jobs = self.db.scalars(
+            select(Job)
+            .options(_RESPONSE_COLUMNS)
+            .where(Job.user_id == user_id, Job.id.in_(set(job_ids)))
+            .order_by(Job.created_at.desc())
+        )
+
+        return [self._to_response(job) for job in jobs]
+
     def list_jobs(
         self,
         user_id: str,
         limit: int = 20,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[JobResponse]:
-        """List jobs for a user, ordered by creation time (newest first)."""
-        jobs = (
-            self.db.query(Job)
-            .filter(Job.user_id == user_id)
-            .order_by(Job.created_at.desc())
+        """
+        List jobs for a user, ordered by creation time (newest first).
+
+        Args:
+            user_id: ID of the user whose jobs to list
+            limit: Maximum number of jobs
+            offset: Number of jobs to skip
+            after: ID of the last job of the previous page; the page starts
+                right after it. Unlike offset, the database seeks straight
+                to it instead of reading and discarding the skipped rows.
+
+        Raises HTTPException 400 if `after` is not one of the user's jobs.
+        """
+        query = (
+            select(Job)
+            .options(_RESPONSE_COLUMNS)
+            .where(Job.user_id == user_id)
+            .order_by(Job.created_at.desc(), Job.id.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
+        if after is not None:
+            cursor = self.db.execute(
+                select(Job.created_at, Job.id).where(
+                    Job.id == after, Job.user_id == user_id
+                )
+            ).first()
+            if cursor is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Unknown pagination cursor",
+                )
+            # Compare (created_at, id) so jobs created in the same instant
+            # are neither skipped nor repeated across pages
+            query = query.where(
+                tuple_(Job.created_at, Job.id) < tuple_(*cursor)
+            )
+
+        jobs = self.db.scalars(query)
+
         return [self._to_response(job) for job in jobs]
 
     def cancel_job(self, job_id: str, user_id: str) -> None:
@@ -118,12 +193,12 @@ class JobService:
         if job.status not in (JobStatus.PENDING, JobStatus.PROCESSING):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot cancel job with status: {job.status.value}",
+                detail=f"Cannot cancel job with status: {job.status}",
             )
 
-        job.status = JobStatus.CANCELLED
+        job.status = JobStatus.CANCELLED.value
         job.completed_at = datetime.now(timezone.utc)
-        self.db.commit()
+        self._commit(job_id)
 
     def update_progress(
         self,
@@ -135,22 +210,41 @@ class JobService:
         total_chunks: int = 0,
     ) -> None:
         """Update job progress (called by worker)."""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            job.stage = stage
-            job.progress_percent = progress_percent
-            job.message = message
-            job.current_chunk = current_chunk
-            job.total_chunks = total_chunks
-            self.db.commit()
-
-    def mark_started(self, job_id: str) -> None:
-        """Mark a job as started processing."""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            job.status = JobStatus.PROCESSING
-            job.started_at = datetime.now(timezone.utc)
-            self.db.commit()
+        self._update(
+            job_id,
+            stage=stage,
+            progress_percent=progress_percent,
+            message=message,
+            current_chunk=current_chunk,
+            total_chunks=total_chunks,
+        )
+
+    def claim(self, job_id: str, worker_id: str) -> bool:
+        """
+        Mark a pending job as processing by the given worker.
+
+        The status check and the write are a single UPDATE, so when several
+        workers or processes race for the same job exactly one of them wins.
+
+        Returns:
+            True if this worker claimed the job, False if it doesn't exist
+            or is no longer pending
+        """
+        result = self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.PENDING.value)
+            .values(
+                status=JobStatus.PROCESSING.value,
+                started_at=datetime.now(timezone.utc),
+                worker_id=worker_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            self.db.rollback()
+            return False
+        self._commit(job_id)
+        return True
 
     def mark_completed(
         self,
@@ -160,29 +254,52 @@ class JobService:
         chapters_count: int,
     ) -> None:
         """Mark a job as completed successfully."""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            job.status = JobStatus.COMPLETED
-            job.completed_at = datetime.now(timezone.utc)
-            job.output_s3_key = output_s3_key
-            job.duration_seconds = duration_seconds
-            job.chapters_count = chapters_count
-            job.progress_percent = 100
-            self.db.commit()
+        self._update(
+            job_id,
+            status=JobStatus.COMPLETED.value,
+            completed_at=datetime.now(timezone.utc),
+            output_s3_key=output_s3_key,
+            duration_seconds=duration_seconds,
+            chapters_count=chapters_count,
+            progress_percent=100,
+        )
 
     def mark_failed(self, job_id: str, error_message: str) -> None:
         """Mark a job as failed."""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.now(timezone.utc)
-            job.error_message = error_message
-            self.db.commit()
+        self._update(
+            job_id,
+            status=JobStatus.FAILED.value,
+            completed_at=datetime.now(timezone.utc),
+            error_message=error_message,
+        )
+
+    def _update(self, job_id: str, **values) -> None:
+        """
+        Write fields of a job in a single UPDATE and commit.
+
+        Skips the SELECT an ORM load would need first; a job that no longer
+        exists is silently ignored, as it was before.
+        """
+        result = self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            self._commit(job_id)
+        else:
+            self.db.rollback()
+
+    def _commit(self, job_id: str) -> None:
+        """Commit job changes and wake any SSE streams watching the job."""
+        self.db.commit()
+        get_job_event_bus().publish(job_id)
 
     def _to_response(self, job: Job) -> JobResponse:
         """Convert a Job model to JobResponse."""
         progress = JobProgress(
-            status=job.status.value,
+            status=job.status,
             stage=job.stage,
             progress_percent=job.progress_percent or 0,
             current_chunk=job.current_chunk or 0,
@@ -200,7 +317,7 @@ class JobService:
 
         return JobResponse(
             id=job.id,
-            status=job.status.value,
+            status=job.status,
             input_filename=job.input_filename,
             voice=job.voice,
             speed=job.speed,
@@ -1,16 +1,37 @@
 """S3-compatible storage service for file uploads and downloads."""
 
 import shutil
-import uuid
+import threading
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 
 from ..config import Settings, get_settings
+from ..db.models import uuid7
+
+# Copy uploads in fixed-size pieces so memory use doesn't scale with file size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Split S3 transfers over 8 MB into 8 MB parts moved over parallel
+# connections; a single stream falls well short of the link's throughput
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# How long a successful existence check is trusted. Clients typically
+# preview chapters/text and then create a job for the same upload within
+# seconds, so this spares the repeated HEAD requests.
+EXISTS_CACHE_TTL_SECONDS = 60
 
 
 class StorageService:
@@ -19,13 +40,33 @@ class StorageService:
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or get_settings()
         self._client: Optional[boto3.client] = None
+        self._client_lock = threading.Lock()
         self._use_local = self.settings.use_local_storage or not self.settings.s3_configured
+        # Keys known to exist in S3. Only hits are cached, so a file that
+        # is still being uploaded is never remembered as missing.
+        self._known_keys: TTLCache = TTLCache(
+            maxsize=4096, ttl=EXISTS_CACHE_TTL_SECONDS
+        )
+        self._known_keys_lock = threading.Lock()
+        # Signed download URLs, reused for the first half of their lifetime
+        # so a handed-out URL always has at least half of it left. Spares
+        # re-signing every completed job each time a job list is polled.
+        self._download_urls: TTLCache = TTLCache(
+            maxsize=4096, ttl=self.settings.download_url_expire_seconds / 2
+        )
+        self._download_urls_lock = threading.Lock()
 
         if self._use_local:
             # Create local storage directory
             self._local_path = Path(self.settings.local_storage_path)
             self._local_path.mkdir(parents=True, exist_ok=True)
 
+    def local_path(self, key: str) -> Path:
+        """Get the on-disk path of a key in local storage mode."""
+        if not self._use_local:
+            raise RuntimeError("Local paths not available in S3 storage mode")
+        return self._local_path / key
+
     @property
     def client(self):
         """Lazy-initialize S3 client."""
@@ -33,14 +74,31 @@ class StorageService:
             raise RuntimeError("S3 client not available in local storage mode")
 
         if self._client is None:
-            self._client = boto3.client(
-                "s3",
-                endpoint_url=self.settings.s3_endpoint_url,
-                aws_access_key_id=self.settings.s3_access_key_id,
-                aws_secret_access_key=self.settings.s3_secret_access_key,
-                region_name=self.settings.s3_region,
-                config=Config(signature_version="s3v4"),
-            )
+            # boto3's default session isn't thread-safe, and the first
+            # requests after startup may arrive on several threads at once
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        "s3",
+                        endpoint_url=self.settings.s3_endpoint_url,
+                        aws_access_key_id=self.settings.s3_access_key_id,
+                        aws_secret_access_key=self.settings.s3_secret_access_key,
+                        region_name=self.settings.s3_region,
+                        config=Config(
+                            signature_version="s3v4",
+                            # Every job worker may be moving a full set of parts
+                            max_pool_connections=max(
+                                50,
+                                TRANSFER_CONFIG.max_concurrency
+                                * self.settings.max_concurrent_jobs,
+                            ),
+                            tcp_keepalive=True,
+                            # Fail fast on a stalled endpoint and let retries kick in
+                            connect_timeout=3,
+                            read_timeout=10,
+                            retries={"mode": "standard", "total_max_attempts": 3},
+                        ),
+                    )
         return self._client
 
     @property
@@ -55,8 +113,9 @@ class StorageService:
         Returns:
             dict with upload_url, upload_key, and expires_in
         """
-        # Create unique key: uploads/{user_id}/{uuid}/{filename}
-        key = f"uploads/{user_id}/{uuid.uuid4()}/{filename}"
+        # Create unique key: uploads/{user_id}/{uuid}/{filename}. The UUID is
+        # time-ordered, so a user's uploads list in upload order.
+        key = f"uploads/{user_id}/{uuid7()}/{filename}"
 
         if self._use_local:
             # For local storage, return a direct upload endpoint
@@ -94,27 +153,42 @@ class StorageService:
             # For local storage, return a direct download endpoint
             return f"/api/v1/convert/download-local/{key}"
 
+        with self._download_urls_lock:
+            url = self._download_urls.get((key, filename))
+        if url is not None:
+            return url
+
         params = {"Bucket": self.bucket, "Key": key}
         if filename:
             params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
 
-        return self.client.generate_presigned_url(
+        url = self.client.generate_presigned_url(
             "get_object",
             Params=params,
             ExpiresIn=self.settings.download_url_expire_seconds,
         )
 
+        with self._download_urls_lock:
+            self._download_urls[(key, filename)] = url
+        return url
+
     def file_exists(self, key: str) -> bool:
         """Check if a file exists in storage."""
         if self._use_local:
-            return (self._local_path / key).exists()
+            return (self.local_path(key)).exists()
+
+        with self._known_keys_lock:
+            if key in self._known_keys:
+                return True
 
         try:
             self.client.head_object(Bucket=self.bucket, Key=key)
-            return True
         except ClientError:
             return False
 
+        self._remember_key(key)
+        return True
+
     def download_to_temp(self, key: str) -> Path:
         """
         Download a file to a temporary location.
@@ -124,36 +198,39 @@ class StorageService:
         """
         if self._use_local:
             # For local storage, just return the path directly
-            local_file = self._local_path / key
+            local_file = self.local_path(key)
             if not local_file.exists():
                 raise FileNotFoundError(f"File not found: {key}")
             return local_file
 
         suffix = Path(key).suffix
-        temp_file = NamedTemporaryFile(suffix=suffix, delete=False)
+        with NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
 
+        # download_file writes each ranged part straight to its offset in the
+        # file, rather than funnelling parts through one file object
         try:
-            self.client.download_fileobj(self.bucket, key, temp_file)
-            temp_file.close()
-            return Path(temp_file.name)
+            self.download_to_file(key, temp_path)
+            return temp_path
         except Exception:
-            temp_file.close()
-            Path(temp_file.name).unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
             raise
 
     def download_to_file(self, key: str, local_path: Path) -> None:
         """Download a file to a specific local path."""
         if self._use_local:
-            source = self._local_path / key
+            source = self.local_path(key)
             shutil.copy2(source, local_path)
             return
 
-        self.client.download_file(self.bucket, key, str(local_path))
+        self.client.download_file(
+            self.bucket, key, str(local_path), Config=TRANSFER_CONFIG
+        )
 
     def upload_file(self, local_path: Path, key: str) -> None:
         """Upload a local file to storage."""
         if self._use_local:
-            dest = self._local_path / key
+            dest = self.local_path(key)
             dest.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(local_path, dest)
             return
@@ -164,24 +241,53 @@ class StorageService:
             self.bucket,
             key,
             ExtraArgs={"ContentType": content_type},
+            Config=TRANSFER_CONFIG,
         )
+        self._remember_key(key)
 
-    def save_upload(self, key: str, content: bytes) -> None:
-        """Save uploaded content directly (for local storage mode)."""
-        if not self._use_local:
-            raise RuntimeError("save_upload only available in local storage mode")
-        dest = self._local_path / key
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(content)
+    def save_upload_stream(self, key: str, fileobj: BinaryIO) -> None:
+        """
+        Save an uploaded file by streaming it in chunks.
+
+        Args:
+            key: Storage key for the file
+            fileobj: Readable binary file object (e.g. UploadFile.file)
+        """
+        if self._use_local:
+            dest = self.local_path(key)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with open(dest, "wb") as f:
+                shutil.copyfileobj(fileobj, f, UPLOAD_CHUNK_SIZE)
+            return
+
+        self.client.upload_fileobj(
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": self._get_content_type(key)},
+            Config=TRANSFER_CONFIG,
+        )
+        self._remember_key(key)
 
     def delete_file(self, key: str) -> None:
         """Delete a file from storage."""
         if self._use_local:
-            (self._local_path / key).unlink(missing_ok=True)
+            (self.local_path(key)).unlink(missing_ok=True)
             return
 
+        with self._known_keys_lock:
+            self._known_keys.pop(key, None)
+        # URLs are cached per (key, filename); drop every one for this key
+        with self._download_urls_lock:
+            for cached in [k for k in self._download_urls if k[0] == key]:
+                self._download_urls.pop(cached, None)
         self.client.delete_object(Bucket=self.bucket, Key=key)
 
+    def _remember_key(self, key: str) -> None:
+        """Record that a key exists in S3."""
+        with self._known_keys_lock:
+            self._known_keys[key] = True
+
     def _get_content_type(self, filename: str) -> str:
         """Get MIME type for a filename."""
         ext = Path(filename).suffix.lower()
@@ -194,6 +300,7 @@ class StorageService:
         }.get(ext, "application/octet-stream")
 
 
+@lru_cache
 def get_storage_service() -> StorageService:
-    """Dependency for getting the storage service."""
+    """Dependency for getting the shared storage service (and its S3 client)."""
     return StorageService()
@@ -0,0 +1,243 @@
+"""Shared TTS synthesis with dynamic batching across concurrent jobs."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import numpy as np
+
+from ...audio_synthesizer import KokoroSynthesizer, voice_lang_code
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _SynthesisRequest:
+    """A single text chunk waiting to be synthesized."""
+
+    text: str
+    voice: str
+    speed: float
+    future: Future = field(default_factory=Future)
+
+
+class SynthesisBatcher:
+    """
+    Pool text chunks from all in-flight jobs and synthesize them in batches.
+
+    A single dispatcher thread owns one warm Kokoro pipeline per language.
+    Each iteration it drains up to ``max_batch_size`` pending requests (waiting
+    at most ``max_wait_ms`` for stragglers), groups them by voice and speed,
+    and hands each group to ``synthesize_batch`` in one call. Results are
+    delivered back to the submitting job through futures.
+
+    Each job waits on one chunk at a time, so a batch never holds more
+    requests than there are jobs inside ``active_job()``; the batcher stops
+    waiting as soon as every active job has a chunk in the batch.
+    """
+
+    def __init__(
+        self,
+        device: str = "cuda",
+        precision: str = "fp32",
+        max_batch_size: int = 2,
+        max_wait_ms: float = 20,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            device: Device for TTS ('cuda' or 'cpu')
+            precision: Inference precision (see KokoroSynthesizer)
+            max_batch_size: Maximum chunks per batch; more than the number
+                of concurrent jobs can never fill
+            max_wait_ms: Maximum time to wait for a batch to fill up
+        """
+        self.device = device
+        self.precision = precision
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self._requests: queue.Queue[_SynthesisRequest] = queue.Queue()
+        self._synthesizers: dict[str, KokoroSynthesizer] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._active_jobs = 0
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the model's sample rate."""
+        return 24000  # Kokoro uses 24kHz
+
+    def submit(self, text: str, voice: str, speed: float = 1.0) -> Future:
+        """
+        Queue a text chunk for synthesis.
+
+        Returns:
+            Future resolving to the audio as a float32 numpy array
+        """
+        self._ensure_started()
+        request = _SynthesisRequest(text=text, voice=voice, speed=speed)
+        self._requests.put(request)
+        return request.future
+
+    @contextmanager
+    def active_job(self) -> Iterator[None]:
+        """Count a job as submitting chunks for as long as the context is open."""
+        with self._lock:
+            self._active_jobs += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active_jobs -= 1
+
+    def warmup(self, voice: str) -> Future:
+        """
+        Load the pipeline for a voice's language and run one short synthesis.
+
+        Returns:
+            Future that resolves once the model is resident
+        """
+        return self.submit("Hello.", voice)
+
+    def _ensure_started(self) -> None:
+        """Start the dispatcher thread on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="ebook-tts-synthesis",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Dispatcher loop: collect a batch, synthesize it, repeat."""
+        while True:
+            batch = self._collect_batch()
+
+            # Group by (voice, speed) so each group is a single batch call
+            groups: dict[tuple[str, float], list[_SynthesisRequest]] = {}
+            for request in batch:
+                groups.setdefault((request.voice, request.speed), []).append(request)
+
+            for (voice, speed), requests in groups.items():
+                try:
+                    audios = self._synthesize_group(voice, speed, [r.text for r in requests])
+                except Exception as e:
+                    logger.exception(f"Batch synthesis failed for voice {voice}")
+                    for request in requests:
+                        request.future.set_exception(e)
+                    continue
+
+                for request, audio in zip(requests, audios, strict=True):
+                    request.future.set_result(audio)
+
+    def _collect_batch(self) -> list[_SynthesisRequest]:
+        """Block for one request, then gather more until full or timed out."""
+        batch = [self._requests.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        # No job has a second chunk queued, so waiting beyond one request
+        # per active job (or for a lone warmup) can't fill the batch further
+        while len(batch) < min(self.max_batch_size, max(1, self._active_jobs)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _synthesize_group(
+        self,
+        voice: str,
+        speed: float,
+        texts: list[str],
+    ) -> list[np.ndarray]:
+        """Synthesize texts that share a voice and speed."""
+        synth = self._get_synthesizer(voice)
+        synth.set_voice(voice)
+        return synth.synthesize_batch(texts, speed=speed)
+
+    def _get_synthesizer(self, voice: str) -> KokoroSynthesizer:
+        """Get the warm synthesizer for a voice's language."""
+        lang_code = voice_lang_code(voice)
+        synth = self._synthesizers.get(lang_code)
+        if synth is None:
+            logger.info(f"Loading Kokoro pipeline for language '{lang_code}'")
+            synth = KokoroSynthesizer(voice=voice, device=self.device, precision=self.precision)
+            self._synthesizers[lang_code] = synth
+        return synth
+
+
+class BatchedSynthesizer:
+    """Per-job synthesizer facade that routes chunks through a SynthesisBatcher."""
+
+    def __init__(self, batcher: SynthesisBatcher, voice: str = "af_heart"):
+        """
+        Initialize the facade.
+
+        Args:
+            batcher: Shared batcher to submit chunks to
+            voice: Voice name (e.g., 'af_heart', 'bf_emma')
+        """
+        self._batcher = batcher
+        self._voice = voice
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the sample rate."""
+        return self._batcher.sample_rate
+
+    def set_voice(self, voice: str, **kwargs) -> bool:
+        """Set the voice used for subsequent chunks."""
+        self._voice = voice
+        return True
+
+    def synthesize(
+        self,
+        text: str,
+        stream: bool = False,
+        speed: float = 1.0,
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize speech from text via the shared batcher.
+
+        Blocks until the batch containing this chunk has been synthesized.
+        """
+        if not text.strip():
+            return
+
+        audio = self._batcher.submit(text, self._voice, speed).result()
+        if len(audio):
+            yield audio
+
+
+_batcher: Optional[SynthesisBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_synthesis_batcher() -> SynthesisBatcher:
+    """Get the process-wide synthesis batcher."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            settings = get_settings()
+            _batcher = SynthesisBatcher(
+                device=settings.tts_device,
+                precision=settings.tts_precision,
+                max_batch_size=(
+                    settings.synthesis_batch_size or settings.max_concurrent_jobs
+                ),
+                max_wait_ms=settings.synthesis_batch_wait_ms,
+            )
+        return _batcher
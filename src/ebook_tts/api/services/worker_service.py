@@ -3,17 +3,63 @@
 import json
 import logging
 import os
+import queue
+import secrets
+import socket
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional
 
 from ..config import get_settings
 from ..db.database import SessionLocal
 from ..db.models import Job, JobStatus
 from .job_service import JobService
-from .storage_service import StorageService
+from .storage_service import StorageService, get_storage_service
+from .synthesis_service import BatchedSynthesizer, get_synthesis_batcher
 
 logger = logging.getLogger(__name__)
 
+# Recorded on every job this process claims. The host and pid let a later
+# process on the same machine check whether the owner is still running; the
+# random token tells a restarted process that reuses the pid (as PID 1 in a
+# container does) apart from the run that claimed the job.
+_HOSTNAME = socket.gethostname()
+WORKER_ID = f"{_HOSTNAME}:{os.getpid()}:{secrets.token_hex(4)}"
+
+
+def _worker_is_gone(worker_id: Optional[str]) -> bool:
+    """Check whether the process that claimed a job has certainly exited."""
+    if not worker_id:
+        # Claimed before owners were recorded, when only one process ran
+        return True
+
+    host, pid, _ = worker_id.rsplit(":", 2)
+    if host != _HOSTNAME or os.name != "posix":
+        # Another machine's processes can't be checked from here
+        return False
+    if worker_id == WORKER_ID:
+        return False
+    if int(pid) == os.getpid():
+        return True
+
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass  # Exists, but belongs to another user
+    return False
+
+
+@contextmanager
+def _job_session(storage: StorageService) -> Iterator[JobService]:
+    """Open a short-lived session for a single job read or update."""
+    with SessionLocal() as db:
+        yield JobService(db, storage)
+
 
 class WorkerService:
     """Service for processing conversion jobs in the background."""
@@ -23,30 +69,28 @@ class WorkerService:
         """
         Process a conversion job.
 
-        This runs as a background task and handles:
+        This runs on a JobQueue worker thread and handles:
         1. Downloading input file from S3
         2. Running the TTS conversion
         3. Uploading output to S3
         4. Updating job status throughout
+
+        Each database access opens its own short-lived session, so a job
+        doesn't hold a pooled connection for the minutes it spends
+        synthesizing.
         """
         settings = get_settings()
-        db = SessionLocal()
-        storage = StorageService(settings)
-        job_service = JobService(db, storage)
+        storage = get_storage_service()
 
         try:
-            # Get job from database
-            job = db.query(Job).filter(Job.id == job_id).first()
-            if not job:
-                logger.error(f"Job {job_id} not found")
-                return
-
-            if job.status != JobStatus.PENDING:
-                logger.warning(f"Job {job_id} is not pending, skipping")
-                return
-
-            # Mark as processing
-            job_service.mark_started(job_id)
+            with _job_session(storage) as job_service:
+                # Claim atomically so no other worker or process can start
+                # the same job, then load it; it stays usable once the
+                # session is closed
+                if not job_service.claim(job_id, WORKER_ID):
+                    logger.warning(f"Job {job_id} is missing or not pending, skipping")
+                    return
+                job = job_service.db.get(Job, job_id)
             logger.info(f"Starting job {job_id}")
 
             # Create temp directory for processing
@@ -69,16 +113,32 @@ class WorkerService:
                 if job.chapters_to_convert:
                     chapters_to_convert = json.loads(job.chapters_to_convert)
 
-                # Create progress callback that updates DB
+                # Create progress callback that updates DB. Chunk-level
+                # updates are throttled so a long book doesn't pay one
+                # commit per chunk; stage changes are always written.
+                last_write = 0.0
+                last_stage = None
+
                 def progress_callback(update):
-                    job_service.update_progress(
-                        job_id=job_id,
-                        stage=update.stage,
-                        progress_percent=update.percent,
-                        message=update.message,
-                        current_chunk=update.chunks_completed,
-                        total_chunks=update.chunks_total,
-                    )
+                    nonlocal last_write, last_stage
+                    now = time.monotonic()
+                    if (
+                        update.stage == last_stage
+                        and now - last_write < settings.progress_update_interval
+                    ):
+                        return
+                    last_write = now
+                    last_stage = update.stage
+
+                    with _job_session(storage) as job_service:
+                        job_service.update_progress(
+                            job_id=job_id,
+                            stage=update.stage,
+                            progress_percent=update.percent,
+                            message=update.message,
+                            current_chunk=update.chunks_completed,
+                            total_chunks=update.chunks_total,
+                        )
 
                 # Force CPU mode by hiding CUDA devices if configured for CPU
                 if settings.tts_device == "cpu":
@@ -89,19 +149,22 @@ class WorkerService:
 
                 # Run conversion
                 logger.info(f"Starting conversion for job {job_id}")
+                batcher = get_synthesis_batcher()
                 converter = PDFToAudiobook(
                     progress_callback=progress_callback,
                     device=settings.tts_device,
                     voice=job.voice,
                     chunk_size=settings.default_chunk_size,
+                    synthesizer=BatchedSynthesizer(batcher, voice=job.voice),
                 )
 
-                result = converter.convert(
-                    input_path=str(input_path),
-                    output_path=str(output_path),
-                    chapters_to_convert=chapters_to_convert,
-                    speed=job.speed,
-                )
+                with batcher.active_job():
+                    result = converter.convert(
+                        input_path=str(input_path),
+                        output_path=str(output_path),
+                        chapters_to_convert=chapters_to_convert,
+                        speed=job.speed,
+                    )
 
                 # Upload output to S3
                 output_key = f"outputs/{job.user_id}/{job.id}/{output_filename}"
@@ -109,12 +172,13 @@ class WorkerService:
                 storage.upload_file(output_path, output_key)
 
                 # Mark job as completed
-                job_service.mark_completed(
-                    job_id=job_id,
-                    output_s3_key=output_key,
-                    duration_seconds=result.duration_seconds,
-                    chapters_count=len(result.chapters),
-                )
+                with _job_session(storage) as job_service:
+                    job_service.mark_completed(
+                        job_id=job_id,
+                        output_s3_key=output_key,
+                        duration_seconds=result.duration_seconds,
+                        chapters_count=len(result.chapters),
+                    )
 
                 logger.info(
                     f"Job {job_id} completed successfully. "
@@ -123,7 +187,145 @@ class WorkerService:
 
         except Exception as e:
             logger.exception(f"Job {job_id} failed: {e}")
-            job_service.mark_failed(job_id, str(e))
+            with _job_session(storage) as job_service:
+                job_service.mark_failed(job_id, str(e))
+
+
+class JobQueue:
+    """
+    In-process job queue drained by a fixed pool of long-lived worker threads.
+
+    Jobs are handed off by ID only; WorkerService.process_job opens its own
+    short-lived database sessions. Workers outlive individual requests, so
+    a new job starts as soon as a worker frees up instead of piggybacking on
+    the lifetime of the HTTP request that created it.
+    """
+
+    def __init__(self, num_workers: int = 1):
+        """
+        Initialize the queue.
+
+        Args:
+            num_workers: Number of worker threads (at least one)
+        """
+        self.num_workers = max(1, num_workers)
+        self._queue: queue.Queue[Optional[str]] = queue.Queue()
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def running(self) -> bool:
+        """Check if the worker threads have been started."""
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Start the worker threads (no-op if already running)."""
+        if self._threads:
+            return
+
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._run,
+                name=f"ebook-tts-worker-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        logger.info(f"Started {self.num_workers} job worker(s)")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Signal the workers to exit once the queue drains.
+
+        Args:
+            timeout: Seconds to wait for each worker (None waits indefinitely)
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def enqueue(self, job_id: str) -> None:
+        """Queue a job for processing."""
+        self._queue.put(job_id)
+
+    def requeue_pending(self) -> int:
+        """
+        Re-queue jobs left pending or in progress by a previous process.
 
+        A processing job is only reset to pending (and started over) when the
+        process that claimed it has certainly exited: an earlier run of this
+        process, or a process on this host that no longer exists. Jobs owned
+        by live processes, such as other uvicorn workers, are left alone, as
+        are jobs claimed on other hosts, which have to be recovered there.
+
+        Returns:
+            Number of jobs queued
+        """
+        db = SessionLocal()
+        try:
+            orphaned = [
+                job_id
+                for job_id, worker_id in db.query(Job.id, Job.worker_id)
+                .filter(Job.status == JobStatus.PROCESSING.value)
+                if _worker_is_gone(worker_id)
+            ]
+            if orphaned:
+                db.query(Job).filter(
+                    Job.id.in_(orphaned),
+                    Job.status == JobStatus.PROCESSING.value,
+                ).update(
+                    {
+                        Job.status: JobStatus.PENDING.value,
+                        Job.stage: None,
+                        Job.progress_percent: 0,
+                        Job.current_chunk: 0,
+                        Job.total_chunks: 0,
+                        Job.message: "Requeued after a server restart",
+                        Job.started_at: None,
+                        Job.worker_id: None,
+                    },
+                    synchronize_session=False,
+                )
+                db.commit()
+                logger.warning(f"Reset {len(orphaned)} interrupted job(s) to pending")
+
+            job_ids = [
+                job_id
+                for (job_id,) in db.query(Job.id)
+                .filter(Job.status == JobStatus.PENDING.value)
+                .order_by(Job.created_at)
+            ]
         finally:
             db.close()
+
+        for job_id in job_ids:
+            self.enqueue(job_id)
+        return len(job_ids)
+
+    def _run(self) -> None:
+        """Worker loop: process queued jobs until a stop sentinel arrives."""
+        while True:
+            job_id = self._queue.get()
+            try:
+                if job_id is None:
+                    return
+                WorkerService.process_job(job_id)
+            except Exception:
+                # process_job records failures on the job itself; never let
+                # an unexpected error take the worker thread down with it.
+                logger.exception(f"Worker crashed while processing job {job_id}")
+            finally:
+                self._queue.task_done()
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Dependency for getting the shared job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(num_workers=get_settings().max_concurrent_jobs)
+    return _job_queue
@@ -1,5 +1,9 @@
 """Audio synthesis using Kokoro TTS."""
 
+import os
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from typing import Iterator, Optional
 
 import numpy as np
@@ -37,6 +41,77 @@ KOKORO_VOICES = {
 }
 
 
+def _group_voices_by_language() -> dict[str, dict[str, str]]:
+    """Group voice descriptions by language code, both sorted by name."""
+    grouped: dict[str, dict[str, str]] = {}
+    for voice, (lang_code, desc) in sorted(KOKORO_VOICES.items()):
+        grouped.setdefault(lang_code, {})[voice] = desc
+    return dict(sorted(grouped.items()))
+
+
+# Voice listings built once instead of scanning KOKORO_VOICES per call
+_VOICES_BY_LANG = _group_voices_by_language()
+_ALL_VOICES = {voice: desc for voice, (_, desc) in KOKORO_VOICES.items()}
+
+# Inference precisions: fp16/bf16 run the model under CUDA autocast, int8
+# dynamically quantizes its Linear layers for CPU inference
+PRECISIONS = ("fp32", "fp16", "bf16", "int8")
+
+
+def join_audio(chunks: list[np.ndarray]) -> np.ndarray:
+    """
+    Join synthesized chunks into one float32 array.
+
+    A single chunk is returned as-is rather than copied; several chunks are
+    copied once into one buffer sized for all of them.
+    """
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks, dtype=np.float32)
+
+
+def voice_lang_code(voice: str) -> str:
+    """Get the Kokoro language code for a voice."""
+    if voice in KOKORO_VOICES:
+        return KOKORO_VOICES[voice][0]
+    # Infer from voice name prefix
+    prefix = voice[:1] if voice else "a"
+    lang_map = {"a": "a", "b": "b", "e": "e", "f": "f", "j": "j", "z": "z"}
+    return lang_map.get(prefix, "a")
+
+
+_pipeline_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _get_pipeline(lang_code: str, device: str, precision: str):
+    """
+    Load a Kokoro pipeline, cached per (language, device, precision).
+
+    Loading reads the model weights from disk and sets up the phonemizer,
+    which takes seconds. Caching at module scope lets every synthesizer
+    in the process, and voice switches back and forth, reuse one instance.
+    """
+    # Force CPU mode if specified (must be set before importing torch)
+    if device == "cpu":
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+    from kokoro import KPipeline
+
+    pipeline = KPipeline(lang_code=lang_code, device=device)
+
+    if precision == "int8":
+        import torch
+
+        pipeline.model = torch.ao.quantization.quantize_dynamic(
+            pipeline.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    return pipeline
+
+
 class KokoroSynthesizer:
     """Wrapper for Kokoro-82M text-to-speech synthesis."""
 
@@ -44,6 +119,7 @@ class KokoroSynthesizer:
         self,
         voice: str = "af_heart",
         device: str = "cuda",
+        precision: str = "fp32",
     ):
         """
         Initialize the Kokoro synthesizer.
@@ -51,20 +127,25 @@ class KokoroSynthesizer:
         Args:
             voice: Voice name (e.g., 'af_heart', 'bf_emma')
             device: Device to use ('cuda' or 'cpu')
+            precision: Inference precision; 'fp16'/'bf16' need CUDA,
+                'int8' needs CPU (see PRECISIONS)
         """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        if precision in ("fp16", "bf16") and device != "cuda":
+            raise ValueError(f"Precision '{precision}' requires device 'cuda'")
+        if precision == "int8" and device != "cpu":
+            raise ValueError("Precision 'int8' requires device 'cpu'")
+
         self.device = device
+        self.precision = precision
         self._pipeline = None
         self._voice = voice
         self._lang_code = self._get_lang_code(voice)
 
     def _get_lang_code(self, voice: str) -> str:
         """Get language code for a voice."""
-        if voice in KOKORO_VOICES:
-            return KOKORO_VOICES[voice][0]
-        # Infer from voice name prefix
-        prefix = voice[:1] if voice else "a"
-        lang_map = {"a": "a", "b": "b", "e": "e", "f": "f", "j": "j", "z": "z"}
-        return lang_map.get(prefix, "a")
+        return voice_lang_code(voice)
 
     @property
     def pipeline(self):
@@ -78,17 +159,24 @@ class KokoroSynthesizer:
         """Get the model's sample rate."""
         return 24000  # Kokoro uses 24kHz
 
-    def _load_pipeline(self) -> None:
-        """Load the Kokoro pipeline."""
-        import os
+    @property
+    def lang_code(self) -> str:
+        """Get the language code of the loaded pipeline."""
+        return self._lang_code
 
-        # Force CPU mode if specified (must be set before importing torch)
-        if self.device == "cpu":
-            os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    def _load_pipeline(self) -> None:
+        """Load the Kokoro pipeline (shared with other synthesizers)."""
+        with _pipeline_lock:
+            self._pipeline = _get_pipeline(self._lang_code, self.device, self.precision)
 
-        from kokoro import KPipeline
+    def _precision_context(self) -> AbstractContextManager:
+        """Context to run one model step in at the configured precision."""
+        if self.precision in ("fp16", "bf16"):
+            import torch
 
-        self._pipeline = KPipeline(lang_code=self._lang_code, device=self.device)
+            dtype = torch.float16 if self.precision == "fp16" else torch.bfloat16
+            return torch.autocast(device_type="cuda", dtype=dtype)
+        return nullcontext()
 
     def set_voice(
         self,
@@ -140,19 +228,26 @@ class KokoroSynthesizer:
         # Generate speech
         generator = self._pipeline(text, voice=self._voice, speed=speed)
 
-        # Yield audio chunks
-        for _gs, _ps, audio in generator:
-            # Convert torch tensor to numpy if needed
-            if hasattr(audio, "numpy"):
-                audio = audio.numpy()
-            elif hasattr(audio, "cpu"):
-                audio = audio.cpu().numpy()
+        # Yield audio chunks. The model runs inside next(), so only that call
+        # is wrapped in the precision context, never the caller's code
+        while True:
+            with self._precision_context():
+                result = next(generator, None)
+            if result is None:
+                break
+            _gs, _ps, audio = result
+
+            # Convert torch tensor to numpy if needed. Kokoro already hands
+            # back CPU float32 tensors, for which cpu() and float() are no-ops
+            # and numpy() a zero-copy view; anything else is copied only once.
+            if hasattr(audio, "cpu"):
+                audio = audio.cpu().float().numpy()
 
             # Ensure correct shape (flatten if needed)
             if audio.ndim > 1:
                 audio = audio.squeeze()
 
-            yield audio.astype(np.float32)
+            yield audio.astype(np.float32, copy=False)
 
     def synthesize_batch(
         self,
@@ -167,14 +262,13 @@ class KokoroSynthesizer:
             speed: Speech speed multiplier
 
         Returns:
-            List of audio arrays
+            List of audio arrays, one per text; empty for texts that
+            produced no audio
         """
-        results = []
-        for text in texts:
-            chunks = list(self.synthesize(text, stream=False, speed=speed))
-            if chunks:
-                results.append(np.concatenate(chunks))
-        return results
+        return [
+            join_audio(list(self.synthesize(text, stream=False, speed=speed)))
+            for text in texts
+        ]
 
     def list_speakers(self) -> list[str]:
         """List available Kokoro voices."""
@@ -187,6 +281,11 @@ class KokoroSynthesizer:
             return KOKORO_VOICES[voice][1]
         return None
 
+    @staticmethod
+    def list_languages() -> list[str]:
+        """List the language codes that have voices, in sorted order."""
+        return list(_VOICES_BY_LANG)
+
     @staticmethod
     def list_voices_by_language(lang: str = None) -> dict[str, str]:
         """
@@ -196,13 +295,18 @@ class KokoroSynthesizer:
             lang: Language code filter ('a'=American, 'b'=British, 'e'=Spanish, etc.)
 
         Returns:
-            Dict of voice_name -> description
+            Dict of voice_name -> description; voices of one language are
+            sorted by name
         """
-        result = {}
-        for voice, (lang_code, desc) in KOKORO_VOICES.items():
-            if lang is None or lang_code == lang:
-                result[voice] = desc
-        return result
+        if lang is None:
+            return dict(_ALL_VOICES)
+        return dict(_VOICES_BY_LANG.get(lang, {}))
+
+
+# Longest clip MockSynthesizer produces (60 s at 24 kHz). Read-only so a
+# caller that tries to modify a yielded view fails instead of corrupting it.
+_MOCK_SILENCE = np.zeros(60 * 24000, dtype=np.float32)
+_MOCK_SILENCE.flags.writeable = False
 
 
 class MockSynthesizer:
@@ -244,24 +348,20 @@ class MockSynthesizer:
         # Clamp duration
         duration_seconds = max(0.1, min(duration_seconds, 60))
 
-        # Generate silence
+        # Generate silence as a view of the shared read-only buffer
         samples = int(duration_seconds * self.sample_rate)
-        silence = np.zeros(samples, dtype=np.float32)
-
-        yield silence
+        yield _MOCK_SILENCE[:samples]
 
     def synthesize_batch(
         self,
         texts: list[str],
         speed: float = 1.0,
     ) -> list[np.ndarray]:
-        """Synthesize multiple texts."""
-        results = []
-        for text in texts:
-            chunks = list(self.synthesize(text, stream=False, speed=speed))
-            if chunks:
-                results.append(np.concatenate(chunks))
-        return results
+        """Synthesize multiple texts, one (possibly empty) array per text."""
+        return [
+            join_audio(list(self.synthesize(text, stream=False, speed=speed)))
+            for text in texts
+        ]
 
     def list_speakers(self) -> list[str]:
         """Return mock speaker list."""
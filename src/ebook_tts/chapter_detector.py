@@ -1,6 +1,7 @@
 """Chapter detection from PDF TOC and text patterns."""
 
 import re
+from bisect import bisect_left
 from typing import Optional
 
 from .progress import Chapter, ExtractedDocument, TOCEntry
@@ -64,6 +65,10 @@ class ChapterDetector:
         (r"^(Prefacio)(?:\s*[:\-.]?\s*(.*))?$", None),
     ]
 
+    # Chapter number within a title, e.g. "12" or "XII". Word boundaries
+    # keep the "C" of "Chapter" from reading as roman 100.
+    _NUMBER_RE = re.compile(r"\b(\d+|[IVXLC]+)\b")
+
     def __init__(
         self,
         min_chapter_length: int = 500,
@@ -79,6 +84,37 @@ class ChapterDetector:
         self.min_chapter_length = min_chapter_length
         self.use_toc_first = use_toc_first
         self._all_patterns = self.EN_PATTERNS + self.ES_PATTERNS
+        self._heading_re, self._heading_groups = self._compile_patterns(self._all_patterns)
+
+    @staticmethod
+    def _compile_patterns(
+        patterns: list[tuple[str, Optional[str]]],
+    ) -> tuple[re.Pattern, dict[str, tuple[int, int, Optional[str]]]]:
+        """
+        Combine line patterns into one regex that scans the whole text.
+
+        Each pattern becomes a named alternative, tried in list order and
+        matched against a whole line plus any surrounding whitespace. The
+        patterns' whitespace classes are narrowed to exclude newlines, so a
+        match never runs on into the next line.
+
+        Returns:
+            Compiled regex, and per alternative name: index of its first
+            capturing group, number of its groups, and its title prefix
+        """
+        alternatives = []
+        groups = {}
+        group_index = 1
+        for i, (pattern, prefix) in enumerate(patterns):
+            body = pattern.removeprefix("^").removesuffix("$").replace(r"\s", r"[^\S\n]")
+            name = f"p{i}"
+            alternatives.append(f"(?P<{name}>{body})")
+            num_groups = re.compile(body).groups
+            groups[name] = (group_index + 1, num_groups, prefix)
+            group_index += 1 + num_groups
+
+        combined = r"^[^\S\n]*(?:" + "|".join(alternatives) + r")[^\S\n]*$"
+        return re.compile(combined, re.IGNORECASE | re.MULTILINE), groups
 
     def detect(self, doc: ExtractedDocument) -> list[Chapter]:
         """
@@ -100,13 +136,8 @@ class ChapterDetector:
         if not chapters:
             chapters = self._from_patterns(doc.text)
 
-        # Filter false positives
-        chapters = self._filter_false_positives(chapters, doc.text)
-
-        # Set end positions
-        chapters = self._set_end_positions(chapters, len(doc.text))
-
-        return chapters
+        # Filter false positives and set end positions
+        return self._finalize_chapters(chapters, len(doc.text))
 
     def _from_toc(
         self,
@@ -123,17 +154,18 @@ class ChapterDetector:
         if not top_level:
             top_level = [entry for entry in toc if entry.level <= 2]
 
+        # Pages are in reading order, so their numbers can be bisected
+        page_nums = [page.page_num for page in pages]
+
         for entry in top_level:
-            # Find character offset for this page
-            char_offset = 0
-            for page in pages:
-                if page.page_num == entry.page_num:
-                    char_offset = page.char_offset
-                    break
-                elif page.page_num > entry.page_num:
-                    # Use previous page's offset
-                    break
-                char_offset = page.char_offset
+            # Find character offset for this page, or else the previous page
+            i = bisect_left(page_nums, entry.page_num)
+            if i < len(pages) and page_nums[i] == entry.page_num:
+                char_offset = pages[i].char_offset
+            elif i > 0:
+                char_offset = pages[i - 1].char_offset
+            else:
+                char_offset = 0
 
             chapters.append(Chapter(
                 title=entry.title,
@@ -146,87 +178,89 @@ class ChapterDetector:
     def _from_patterns(self, text: str) -> list[Chapter]:
         """Detect chapters using regex patterns."""
         chapters = []
-        lines = text.split("\n")
-        char_pos = 0
-
-        for line in lines:
-            stripped = line.strip()
-
-            for pattern, prefix in self._all_patterns:
-                match = re.match(pattern, stripped, re.IGNORECASE)
-                if match:
-                    # Build chapter title
-                    if prefix:
-                        # Numbered chapter: "Chapter 1: Title"
-                        num = match.group(1)
-                        subtitle = match.group(2) if len(match.groups()) > 1 else ""
-                        if subtitle:
-                            title = f"{prefix} {num}: {subtitle}".strip()
-                        else:
-                            title = f"{prefix} {num}"
-                    else:
-                        # Special chapter: "Prologue"
-                        title = match.group(1)
-                        if len(match.groups()) > 1 and match.group(2):
-                            title = f"{title}: {match.group(2)}".strip()
-
-                    chapters.append(Chapter(
-                        title=title,
-                        start_page=0,  # Unknown from pattern matching
-                        start_char=char_pos,
-                    ))
-                    break
-
-            char_pos += len(line) + 1  # +1 for newline
+
+        # One C-level scan over the text instead of every pattern per line;
+        # a match starts at its line's first character
+        for match in self._heading_re.finditer(text):
+            first_group, num_groups, prefix = self._heading_groups[match.lastgroup]
+            first = match.group(first_group)
+            second = (match.group(first_group + 1) or "").strip() if num_groups > 1 else ""
+
+            # Build chapter title
+            if prefix:
+                # Numbered chapter: "Chapter 1: Title"
+                if second:
+                    title = f"{prefix} {first}: {second}"
+                else:
+                    title = f"{prefix} {first}"
+            else:
+                # Special chapter: "Prologue"
+                title = first
+                if second:
+                    title = f"{title}: {second}"
+
+            chapters.append(Chapter(
+                title=title,
+                start_page=0,  # Unknown from pattern matching
+                start_char=match.start(),
+            ))
 
         return chapters
 
-    def _filter_false_positives(
+    def _finalize_chapters(
         self,
         chapters: list[Chapter],
-        full_text: str,
+        text_length: int,
     ) -> list[Chapter]:
-        """Remove chapters that are likely false positives."""
-        if len(chapters) <= 1:
-            return chapters
-
-        filtered = []
+        """
+        Remove likely false positives and set end_char, in a single pass.
 
-        for i, chapter in enumerate(chapters):
-            # Calculate chapter length
-            if i + 1 < len(chapters):
-                end_char = chapters[i + 1].start_char
-            else:
-                end_char = len(full_text)
+        A chapter is dropped when the gap to the next detected heading is
+        shorter than min_chapter_length (a lone chapter is always kept).
+        Each kept chapter then ends where the next kept chapter starts.
+        """
+        if not chapters:
+            return chapters
 
-            chapter_length = end_char - chapter.start_char
+        keep_all = len(chapters) == 1
+        next_starts = [chapter.start_char for chapter in chapters[1:]]
+        next_starts.append(text_length)
 
+        filtered: list[Chapter] = []
+        for chapter, next_start in zip(chapters, next_starts, strict=True):
             # Skip very short "chapters"
-            if chapter_length < self.min_chapter_length:
+            if not keep_all and next_start - chapter.start_char < self.min_chapter_length:
                 continue
 
+            if filtered:
+                filtered[-1].end_char = chapter.start_char
             filtered.append(chapter)
 
-        return filtered
+        if filtered:
+            filtered[-1].end_char = text_length
 
-    def _set_end_positions(
-        self,
-        chapters: list[Chapter],
-        text_length: int,
-    ) -> list[Chapter]:
-        """Set end_char for each chapter."""
-        for i, chapter in enumerate(chapters):
-            if i + 1 < len(chapters):
-                chapter.end_char = chapters[i + 1].start_char
-            else:
-                chapter.end_char = text_length
-
-        return chapters
+        return filtered
 
     def get_chapter_titles(self, chapters: list[Chapter]) -> list[str]:
         """Get list of chapter titles."""
         return [ch.title for ch in chapters]
 
+    def index_by_number(self, chapters: list[Chapter]) -> dict[int, Chapter]:
+        """
+        Map chapter numbers to chapters, for repeated lookups.
+
+        The number is the first arabic or roman numeral in the title. When
+        several chapters share a number, the first one wins.
+        """
+        index: dict[int, Chapter] = {}
+        for chapter in chapters:
+            match = self._NUMBER_RE.search(chapter.title)
+            if match:
+                chapter_num = normalize_chapter_number(match.group(1))
+                if chapter_num is not None:
+                    index.setdefault(chapter_num, chapter)
+        return index
+
     def find_chapter_by_number(
         self,
         chapters: list[Chapter],
@@ -235,6 +269,8 @@ class ChapterDetector:
         """
         Find a chapter by its number.
 
+        To look up several numbers, build index_by_number once instead.
+
         Args:
             chapters: List of chapters
             number: Chapter number to find (1-indexed)
@@ -242,11 +278,4 @@ class ChapterDetector:
         Returns:
             Chapter if found, None otherwise
         """
-        for chapter in chapters:
-            # Try to extract number from title
-            match = re.search(r"(\d+|[IVXLC]+)", chapter.title)
-            if match:
-                chapter_num = normalize_chapter_number(match.group(1))
-                if chapter_num == number:
-                    return chapter
-        return None
+        return self.index_by_number(chapters).get(number)
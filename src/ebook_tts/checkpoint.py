@@ -4,7 +4,7 @@ import json
 import os
 import shutil
 import tempfile
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -48,14 +48,26 @@ class CheckpointState:
         )
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        The dictionary shares its lists with the state rather than deep
+        copying them as dataclasses.asdict would.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+# Scale between float samples in [-1, 1) and 16-bit checkpoint samples. A
+# power of two, like libsndfile's, so reloaded chunks convert back exactly.
+PCM16_SCALE = 32768
 
 
 class CheckpointManager:
     """Manages checkpoint files for resumable conversions."""
 
-    VERSION = 1
+    # Version 2: chunks are raw 16-bit PCM instead of float32 .npy files,
+    # and the input hash is BLAKE2b instead of SHA256
+    VERSION = 2
 
     def __init__(self, checkpoint_dir: Path):
         """
@@ -66,7 +78,10 @@ class CheckpointManager:
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.state_file = self.checkpoint_dir / "state.json"
+        self.completed_log = self.checkpoint_dir / "completed.log"
+        self.input_hash_file = self.checkpoint_dir / "input.hash.json"
         self.chunks_dir = self.checkpoint_dir / "chunks"
+        self._dirs_ready = False
 
     @staticmethod
     def get_checkpoint_dir(output_path: str) -> Path:
@@ -107,20 +122,38 @@ class CheckpointManager:
                     f"(expected {self.VERSION})"
                 )
 
-            return CheckpointState.from_dict(data)
+            state = CheckpointState.from_dict(data)
 
         except json.JSONDecodeError as e:
             raise ValueError(f"Corrupted checkpoint state file: {e}") from e
 
+        # Merge chunks completed since state.json was last written
+        seen = set(state.completed_chunks)
+        for idx in self._read_completed_log():
+            if idx not in seen:
+                seen.add(idx)
+                state.completed_chunks.append(idx)
+
+        return state
+
+    def _read_completed_log(self) -> list[int]:
+        """Read chunk indices appended by mark_completed."""
+        try:
+            data = self.completed_log.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        # Only whole lines count; a crash can leave a partial final entry
+        return [int(line) for line in data.split(b"\n")[:-1] if line.strip().isdigit()]
+
     def save_state(self, state: CheckpointState) -> None:
         """
         Save checkpoint state to disk atomically.
 
-        Uses a temp file + rename to ensure atomicity.
+        Uses a temp file + rename to ensure atomicity. The completed-chunk
+        log is folded into the written state and truncated afterwards.
         """
-        # Ensure directories exist
-        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dirs()
 
         # Update timestamp
         state.updated_at = datetime.now(timezone.utc).isoformat()
@@ -129,27 +162,54 @@ class CheckpointManager:
         fd, temp_path = tempfile.mkstemp(dir=self.checkpoint_dir, suffix=".json")
         try:
             with os.fdopen(fd, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
+                json.dump(state.to_dict(), f, separators=(",", ":"))
             os.replace(temp_path, self.state_file)
         except Exception:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
             raise
 
+        # Every logged chunk is now in state.json. Entries appended by a
+        # crash before this point are merged again (deduplicated) on load.
+        self.completed_log.unlink(missing_ok=True)
+
+    def mark_completed(self, idx: int) -> None:
+        """
+        Record a completed chunk by appending it to the completed-chunk log.
+
+        Much cheaper than save_state, which rewrites the whole state file
+        including every completed index so far.
+        """
+        self._ensure_dirs()
+        with open(self.completed_log, "ab") as f:
+            f.write(f"{idx}\n".encode())
+
+    def _ensure_dirs(self) -> None:
+        """Create the checkpoint and chunk directories, once per manager."""
+        if not self._dirs_ready:
+            self.chunks_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
+
     def chunk_path(self, idx: int) -> Path:
         """Get the path for a chunk file."""
-        return self.chunks_dir / f"{idx:06d}.npy"
+        return self.chunks_dir / f"{idx:06d}.raw"
 
     def save_chunk(self, idx: int, audio: np.ndarray) -> None:
         """
         Save a synthesized audio chunk.
 
+        Chunks are stored as raw little-endian 16-bit PCM, the same precision
+        the output is written at, at half the size of float32.
+
         Args:
             idx: Chunk index
             audio: Audio data as numpy array
         """
-        self.chunks_dir.mkdir(parents=True, exist_ok=True)
-        np.save(self.chunk_path(idx), audio.astype(np.float32))
+        self._ensure_dirs()
+        samples = np.multiply(audio, PCM16_SCALE, dtype=np.float32)
+        np.rint(samples, out=samples)
+        np.clip(samples, -PCM16_SCALE, PCM16_SCALE - 1, out=samples)
+        samples.astype("<i2").tofile(self.chunk_path(idx))
 
     def load_chunk(self, idx: int) -> Optional[np.ndarray]:
         """
@@ -159,17 +219,77 @@ class CheckpointManager:
             idx: Chunk index
 
         Returns:
-            Audio data as numpy array, or None if chunk doesn't exist or is corrupt
+            Audio data as float32 numpy array, or None if chunk doesn't exist
+            or is corrupt
         """
         path = self.chunk_path(idx)
         if not path.exists():
             return None
 
+        # Scale straight from the mapped file into the float32 result, so
+        # the int16 samples never get a heap copy of their own
         try:
-            return np.load(path)
+            samples = np.memmap(path, dtype="<i2", mode="r")
+            return np.multiply(samples, 1 / PCM16_SCALE, dtype=np.float32)
         except Exception:
             return None
 
+    def _cached_input_hash(self, input_path: str) -> str:
+        """
+        Hash the input file, reusing the last result while it is unchanged.
+
+        The hash is cached in the checkpoint directory together with the
+        file's size and modification time, so resuming a large book doesn't
+        reread it just to confirm it's the same file.
+        """
+        stat = os.stat(input_path)
+        key = {"path": os.path.abspath(input_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        try:
+            with open(self.input_hash_file, "r") as f:
+                cached = json.load(f)
+            if {k: cached.get(k) for k in key} == key:
+                return cached["hash"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        file_hash = hash_file(input_path)
+        try:
+            self._ensure_dirs()
+            with open(self.input_hash_file, "w") as f:
+                json.dump({**key, "hash": file_hash}, f)
+        except OSError:
+            # The cache is only an optimization
+            pass
+        return file_hash
+
+    def _intact_chunks(self) -> set[int]:
+        """
+        Get the indices of chunk files that are present and plausibly complete.
+
+        The chunk directory is listed once instead of probing each completed
+        chunk, and only file sizes are checked (non-empty, whole 16-bit
+        samples), so verifying a long book doesn't read any audio back.
+        """
+        intact = set()
+        try:
+            entries = os.scandir(self.chunks_dir)
+        except FileNotFoundError:
+            return intact
+
+        with entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext != ".raw" or not stem.isdigit():
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                if size > 0 and size % 2 == 0:
+                    intact.add(int(stem))
+        return intact
+
     def verify(self, input_path: str, settings: dict) -> tuple[bool, str]:
         """
         Verify that a checkpoint matches the current conversion parameters.
@@ -190,7 +310,7 @@ class CheckpointManager:
             return False, str(e)
 
         # Verify input file hash
-        current_hash = hash_file(input_path)
+        current_hash = self._cached_input_hash(input_path)
         if current_hash != state.input_hash:
             return False, "Input file has changed since checkpoint was created"
 
@@ -200,11 +320,7 @@ class CheckpointManager:
             return False, "Conversion settings have changed"
 
         # Verify chunk files exist for completed chunks
-        missing_chunks = []
-        for idx in state.completed_chunks:
-            chunk = self.load_chunk(idx)
-            if chunk is None:
-                missing_chunks.append(idx)
+        missing_chunks = set(state.completed_chunks) - self._intact_chunks()
 
         if missing_chunks:
             # Remove missing chunks from completed list
@@ -220,6 +336,7 @@ class CheckpointManager:
         """Remove the checkpoint directory and all its contents."""
         if self.checkpoint_dir.exists():
             shutil.rmtree(self.checkpoint_dir)
+        self._dirs_ready = False
 
     def create_state(
         self,
@@ -247,7 +364,7 @@ class CheckpointManager:
         now = datetime.now(timezone.utc).isoformat()
         return CheckpointState(
             version=self.VERSION,
-            input_hash=hash_file(input_path),
+            input_hash=self._cached_input_hash(input_path),
             input_path=str(input_path),
             output_path=str(output_path),
             settings_hash=hash_settings(settings),
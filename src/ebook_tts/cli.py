@@ -3,7 +3,11 @@
 
 import os
 import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 # Force CPU mode early, before torch is imported
 if "--cpu" in sys.argv:
@@ -11,26 +15,51 @@ if "--cpu" in sys.argv:
 
 import click
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from rich.table import Table
 
-from .converter import PDFToAudiobook
-from .progress import ProgressUpdate
+# The converter (and with it PDF/EPUB parsing, numpy and soundfile) and
+# rich's progress bars are imported by the commands that use them, so
+# lightweight commands like list-voices start quickly
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from .progress import ProgressUpdate
 
 console = Console()
 
 
-def create_progress_callback(progress: Progress, task_id):
-    """Create a progress callback for the converter."""
+def create_progress_callback(
+    progress: "Progress",
+    task_id,
+    min_interval: float = 0.1,
+    min_advance: float = 0.5,
+):
+    """
+    Create a progress callback for the converter.
+
+    The converter reports every chunk, so updates are coalesced: the bar is
+    only redrawn once the percentage has moved by ``min_advance`` points or
+    ``min_interval`` seconds have passed. Stage changes, chapter changes and
+    completion are always shown.
+    """
+    last_stage = None
+    last_percent = float("-inf")
+    last_time = float("-inf")
+
+    def callback(update: "ProgressUpdate"):
+        nonlocal last_stage, last_percent, last_time
+
+        now = time.monotonic()
+        if not (
+            update.chapter
+            or update.stage != last_stage
+            or update.percent >= 100
+            or update.percent - last_percent >= min_advance
+            or now - last_time >= min_interval
+        ):
+            return
+        last_stage, last_percent, last_time = update.stage, update.percent, now
 
-    def callback(update: ProgressUpdate):
         # Update progress bar
         progress.update(
             task_id,
@@ -45,6 +74,44 @@ def create_progress_callback(progress: Progress, task_id):
     return callback
 
 
+def _resolve_input(input_path: Optional[str], pdf_path: Optional[str]) -> str:
+    """Pick the input file from --input or the legacy --pdf, exiting if unusable."""
+    if input_path and pdf_path:
+        console.print("[red]Error:[/red] Use either --input or --pdf, not both.")
+        sys.exit(1)
+    if not input_path and not pdf_path:
+        console.print("[red]Error:[/red] Missing input file. Use --input <file>.")
+        sys.exit(1)
+    return input_path or pdf_path
+
+
+def synthesize_in_order(synth, texts: list[str], speed: float, workers: int):
+    """
+    Synthesize texts on a thread pool, yielding each text's audio in order.
+
+    At most ``2 * workers`` texts are in flight, so finished audio doesn't
+    pile up in memory behind one slow text.
+
+    Yields:
+        List of audio arrays for each text, in input order
+    """
+    def synthesize(text: str) -> list:
+        return list(synth.synthesize(text, speed=speed))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for text in texts:
+                pending.append(executor.submit(synthesize, text))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -132,16 +199,21 @@ def convert(
     force: bool,
 ):
     """Convert a PDF or EPUB to an audiobook."""
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from .converter import PDFToAudiobook
+
     console.print("[bold]Document to Audiobook Converter[/bold]")
     console.print()
 
-    if input_path and pdf_path:
-        console.print("[red]Error:[/red] Use either --input or --pdf, not both.")
-        sys.exit(1)
-    if not input_path and not pdf_path:
-        console.print("[red]Error:[/red] Missing input file. Use --input <file>.")
-        sys.exit(1)
-    input_path = input_path or pdf_path
+    input_path = _resolve_input(input_path, pdf_path)
 
     # Parse chapters
     chapters_list = None
@@ -241,6 +313,223 @@ def convert(
     console.print(table)
 
 
+# Converter owned by a convert-batch worker, built once so the model is
+# loaded once per worker instead of once per book
+_batch_converter = None
+
+
+def _init_batch_worker(
+    mock: bool,
+    cpu: bool,
+    voice: str,
+    dict_path: Optional[str],
+    torch_threads: Optional[int],
+) -> None:
+    """Set up a convert-batch worker (runs in each worker process)."""
+    global _batch_converter
+    from .converter import PDFToAudiobook
+
+    # Split the cores between CPU workers; torch reads this when kokoro
+    # first imports it, which happens later in the worker
+    if torch_threads:
+        os.environ["OMP_NUM_THREADS"] = str(torch_threads)
+
+    _batch_converter = PDFToAudiobook(
+        mock_tts=mock,
+        device="cpu" if cpu else "cuda",
+        voice=voice,
+        dictionary_path=dict_path,
+    )
+
+
+def _convert_batch_file(input_path: str, output_path: str, speed: float) -> str:
+    """Convert one book with the worker's converter, returning its duration."""
+    result = _batch_converter.convert(
+        input_path=input_path,
+        output_path=output_path,
+        speed=speed,
+    )
+    return result.duration_formatted
+
+
+def _batch_output_paths(
+    files: list[Path],
+    input_dir: Path,
+    out_dir: Path,
+    output_format: str,
+) -> dict[str, str]:
+    """
+    Map each input file to the audiobook path it's converted to.
+
+    Subdirectories matched by a recursive pattern are mirrored under
+    out_dir, and books that differ only by extension (book.pdf, book.epub)
+    keep it in their output name (book.pdf.mp3, book.epub.mp3).
+    """
+    relative = {path: path.relative_to(input_dir) for path in files}
+    stems = Counter(rel.with_suffix("") for rel in relative.values())
+
+    jobs = {}
+    for path, rel in relative.items():
+        name = rel.name if stems[rel.with_suffix("")] > 1 else rel.stem
+        jobs[str(path)] = str(out_dir / rel.parent / f"{name}.{output_format}")
+    return jobs
+
+
+@cli.command("convert-batch")
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--output-dir", "-o",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for the audiobooks (default: the input directory)",
+)
+@click.option(
+    "--pattern",
+    type=str,
+    default="*.pdf",
+    help="Glob pattern selecting the input files (default: '*.pdf')",
+)
+@click.option(
+    "--format", "-f", "output_format",
+    type=click.Choice(["wav", "mp3", "m4b"]),
+    default="wav",
+    help="Output audio format (default: wav)",
+)
+@click.option(
+    "--voice", "-v",
+    type=str,
+    default="af_heart",
+    help="Kokoro voice name (e.g., 'af_heart', 'bf_emma')",
+)
+@click.option(
+    "--speed", "-s",
+    type=float,
+    default=1.0,
+    help="Speech speed multiplier (0.5-2.0, default: 1.0)",
+)
+@click.option(
+    "--mock/--no-mock",
+    default=False,
+    help="Use mock TTS for testing (generates silence)",
+)
+@click.option(
+    "--cpu/--gpu",
+    default=False,
+    help="Use CPU instead of GPU for inference",
+)
+@click.option(
+    "--dict", "-d", "dict_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to YAML pronunciation dictionary for custom word replacements",
+)
+@click.option(
+    "--workers", "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Books to convert in parallel (default: 1 on GPU, one per core on CPU)",
+)
+def convert_batch(
+    input_dir: str,
+    output_dir: Optional[str],
+    pattern: str,
+    output_format: str,
+    voice: str,
+    speed: float,
+    mock: bool,
+    cpu: bool,
+    dict_path: Optional[str],
+    workers: Optional[int],
+):
+    """
+    Convert every matching PDF or EPUB in a directory.
+
+    Audiobooks mirror the input's subdirectories under the output directory.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    files = sorted(path for path in Path(input_dir).glob(pattern) if path.is_file())
+    if not files:
+        console.print(f"[yellow]No files matching '{pattern}' in {input_dir}[/yellow]")
+        return
+
+    out_dir = Path(output_dir) if output_dir else Path(input_dir)
+    jobs = _batch_output_paths(files, Path(input_dir), out_dir, output_format)
+
+    # Two books written to one file would overwrite each other, possibly
+    # from two workers at once
+    duplicates = [
+        output_path for output_path, count in Counter(jobs.values()).items() if count > 1
+    ]
+    if duplicates:
+        console.print(f"[red]Error: Several inputs would be written to {duplicates[0]}[/red]")
+        sys.exit(1)
+
+    for output_path in jobs.values():
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    # Each worker holds its own model: on GPU one copy is usually all the
+    # VRAM allows, on CPU the cores are shared out between workers
+    if workers is None:
+        workers = 1 if not (cpu or mock) else os.cpu_count() or 1
+    workers = min(workers, len(files))
+    torch_threads = max(1, (os.cpu_count() or 1) // workers) if cpu and workers > 1 else None
+    init_args = (mock, cpu, voice, dict_path, torch_threads)
+
+    console.print(f"[bold]Converting {len(files)} file(s) with {workers} worker(s)[/bold]")
+    console.print()
+
+    results: dict[str, str] = {}
+    failed = 0
+
+    def record(input_path: str, duration: Optional[str], error: Optional[Exception]):
+        nonlocal failed
+        name = Path(input_path).name
+        if error is None:
+            results[input_path] = duration
+            console.print(f"  [green]Done:[/green] {name} ({duration})")
+        else:
+            failed += 1
+            results[input_path] = f"[red]Failed: {error}[/red]"
+            console.print(f"  [red]Failed:[/red] {name}: {error}")
+
+    if workers == 1:
+        # No pool needed; the one converter is reused for every book
+        _init_batch_worker(*init_args)
+        for input_path, output_path in jobs.items():
+            try:
+                record(input_path, _convert_batch_file(input_path, output_path, speed), None)
+            except Exception as e:
+                record(input_path, None, e)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=init_args,
+        ) as executor:
+            futures = {
+                executor.submit(_convert_batch_file, input_path, output_path, speed): input_path
+                for input_path, output_path in jobs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    record(futures[future], future.result(), None)
+                except Exception as e:
+                    record(futures[future], None, e)
+
+    console.print()
+    table = Table(show_header=False)
+    table.add_column("Output file", style="cyan")
+    table.add_column("Duration")
+    for input_path, output_path in jobs.items():
+        table.add_row(output_path, results[input_path])
+    console.print(table)
+
+    if failed:
+        console.print(f"[red]{failed} of {len(files)} conversion(s) failed[/red]")
+        sys.exit(1)
+
+
 @cli.command()
 @click.option(
     "--input", "-i",
@@ -258,13 +547,9 @@ def convert(
 )
 def chapters(input_path: str, pdf_path: str):
     """List chapters detected in a document."""
-    if input_path and pdf_path:
-        console.print("[red]Error:[/red] Use either --input or --pdf, not both.")
-        sys.exit(1)
-    if not input_path and not pdf_path:
-        console.print("[red]Error:[/red] Missing input file. Use --input <file>.")
-        sys.exit(1)
-    input_path = input_path or pdf_path
+    from .converter import PDFToAudiobook
+
+    input_path = _resolve_input(input_path, pdf_path)
 
     converter = PDFToAudiobook(mock_tts=True)
     detected = converter.extract_chapters(input_path)
@@ -310,13 +595,9 @@ def chapters(input_path: str, pdf_path: str):
 )
 def preview(input_path: str, pdf_path: str, chars: int):
     """Preview processed text from a document."""
-    if input_path and pdf_path:
-        console.print("[red]Error:[/red] Use either --input or --pdf, not both.")
-        sys.exit(1)
-    if not input_path and not pdf_path:
-        console.print("[red]Error:[/red] Missing input file. Use --input <file>.")
-        sys.exit(1)
-    input_path = input_path or pdf_path
+    from .converter import PDFToAudiobook
+
+    input_path = _resolve_input(input_path, pdf_path)
 
     converter = PDFToAudiobook(mock_tts=True)
     text = converter.preview_text(input_path, max_chars=chars)
@@ -371,13 +652,7 @@ def extract(input_path: str, pdf_path: str, output: str, processed: bool, includ
     from .pronunciation_dict import load_dictionary
     from .text_preprocessor import TextPreprocessor
 
-    if input_path and pdf_path:
-        console.print("[red]Error:[/red] Use either --input or --pdf, not both.")
-        sys.exit(1)
-    if not input_path and not pdf_path:
-        console.print("[red]Error:[/red] Missing input file. Use --input <file>.")
-        sys.exit(1)
-    input_path = input_path or pdf_path
+    input_path = _resolve_input(input_path, pdf_path)
 
     # Determine output path
     if output is None:
@@ -410,40 +685,42 @@ def extract(input_path: str, pdf_path: str, output: str, processed: bool, includ
             console.print("[yellow]Warning:[/yellow] --dict requires --processed flag")
         text = doc.text
 
-    # Build output content
-    lines = []
+    # Build metadata header
+    header_lines = []
 
     if include_meta:
-        lines.append("=" * 60)
-        lines.append("METADATA")
-        lines.append("=" * 60)
+        header_lines.append("=" * 60)
+        header_lines.append("METADATA")
+        header_lines.append("=" * 60)
         for key, value in doc.metadata.items():
             if value:
-                lines.append(f"{key}: {value}")
-        lines.append("")
+                header_lines.append(f"{key}: {value}")
+        header_lines.append("")
 
         if chapters_list:
-            lines.append("=" * 60)
-            lines.append("CHAPTERS")
-            lines.append("=" * 60)
+            header_lines.append("=" * 60)
+            header_lines.append("CHAPTERS")
+            header_lines.append("=" * 60)
             for i, ch in enumerate(chapters_list, 1):
                 if suffix == ".epub":
                     page_info = f" (section {ch.start_page})" if ch.start_page else ""
                 else:
                     page_info = f" (page {ch.start_page})" if ch.start_page else ""
-                lines.append(f"{i}. {ch.title}{page_info}")
-            lines.append("")
+                header_lines.append(f"{i}. {ch.title}{page_info}")
+            header_lines.append("")
 
-        lines.append("=" * 60)
-        lines.append("TEXT")
-        lines.append("=" * 60)
-        lines.append("")
+        header_lines.append("=" * 60)
+        header_lines.append("TEXT")
+        header_lines.append("=" * 60)
+        header_lines.append("")
 
-    lines.append(text)
-
-    # Write to file
+    # Write to file; the text goes out as-is rather than being joined onto
+    # the header, which would copy the whole book once more
     output_path = Path(output)
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    with open(output_path, "w", encoding="utf-8") as f:
+        if header_lines:
+            f.write("\n".join(header_lines) + "\n")
+        f.write(text)
 
     # Print summary
     console.print()
@@ -522,7 +799,7 @@ def demo():
 )
 def list_voices(lang: str):
     """List available Kokoro voices."""
-    from .audio_synthesizer import KOKORO_VOICES, KokoroSynthesizer
+    from .audio_synthesizer import KokoroSynthesizer
 
     console.print("[bold]Available Kokoro Voices[/bold]")
     console.print()
@@ -537,33 +814,25 @@ def list_voices(lang: str):
         "z": "Chinese",
     }
 
-    voices = KokoroSynthesizer.list_voices_by_language(lang)
-
     if lang:
         console.print(f"[cyan]{lang_names.get(lang, lang)}[/cyan]")
         table = Table()
         table.add_column("Voice", style="green")
         table.add_column("Description")
 
-        for voice_name, desc in sorted(voices.items()):
+        for voice_name, desc in KokoroSynthesizer.list_voices_by_language(lang).items():
             table.add_row(voice_name, desc)
 
         console.print(table)
     else:
-        # Group by language
-        by_lang = {}
-        for voice_name, (lang_code, desc) in KOKORO_VOICES.items():
-            if lang_code not in by_lang:
-                by_lang[lang_code] = []
-            by_lang[lang_code].append((voice_name, desc))
-
-        for lang_code in sorted(by_lang.keys()):
+        # Voices come pre-grouped and sorted by language
+        for lang_code in KokoroSynthesizer.list_languages():
             console.print(f"[cyan]{lang_names.get(lang_code, lang_code)}[/cyan]")
             table = Table(show_header=False)
             table.add_column("Voice", style="green", width=15)
             table.add_column("Description")
 
-            for voice_name, desc in sorted(by_lang[lang_code]):
+            for voice_name, desc in KokoroSynthesizer.list_voices_by_language(lang_code).items():
                 table.add_row(voice_name, desc)
 
             console.print(table)
@@ -610,15 +879,37 @@ def list_voices(lang: str):
     default=None,
     help="Path to YAML pronunciation dictionary for custom word replacements",
 )
-def text_to_wav(input: str, output: str, voice: str, speed: float, preprocess: bool, dict_path: str):
+@click.option(
+    "--workers", "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of chunks to synthesize concurrently (default: 1)",
+)
+def text_to_wav(
+    input: str,
+    output: str,
+    voice: str,
+    speed: float,
+    preprocess: bool,
+    dict_path: str,
+    workers: int,
+):
     """Convert a text file to WAV audio."""
-    import numpy as np
-    import soundfile as sf
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
 
     from .audio_synthesizer import KokoroSynthesizer
+    from .audio_writer import StreamingAudioWriter
     from .pronunciation_dict import load_dictionary
     from .text_chunker import TextChunker
     from .text_preprocessor import TextPreprocessor
+    from .utils import format_duration
 
     console.print("[bold]Text to WAV Converter[/bold]")
     console.print()
@@ -626,9 +917,11 @@ def text_to_wav(input: str, output: str, voice: str, speed: float, preprocess: b
     # Read text file
     text = Path(input).read_text(encoding="utf-8")
 
-    # Skip metadata headers if present (from extract command)
-    if "====" in text and "TEXT" in text:
-        text = text.split("TEXT")[-1].strip("=\n ")
+    # Skip metadata headers if present (from extract command); the header's
+    # rules come before its TEXT marker
+    head, marker, body = text.rpartition("TEXT")
+    if marker and "====" in head:
+        text = body.strip("=\n ")
 
     console.print(f"[dim]Input: {input} ({len(text):,} characters)[/dim]")
     console.print(f"[dim]Voice: {voice}[/dim]")
@@ -655,9 +948,12 @@ def text_to_wav(input: str, output: str, voice: str, speed: float, preprocess: b
 
     console.print()
 
-    # Synthesize with progress
-    all_audio = []
-    with Progress(
+    # Synthesize with progress, streaming audio to the file as it's produced
+    with StreamingAudioWriter(
+        output,
+        sample_rate=synth.sample_rate,
+        output_format="wav",
+    ) as writer, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -667,21 +963,14 @@ def text_to_wav(input: str, output: str, voice: str, speed: float, preprocess: b
     ) as progress:
         task = progress.add_task("[cyan]Synthesizing...", total=len(chunks))
 
-        for i, chunk in enumerate(chunks):
-            for audio in synth.synthesize(chunk.text, speed=speed):
-                all_audio.append(audio)
+        texts = [chunk.text for chunk in chunks]
+        for i, audios in enumerate(synthesize_in_order(synth, texts, speed, workers)):
+            for audio in audios:
+                writer.write(audio)
             progress.update(task, advance=1, description=f"[cyan]Chunk {i+1}/{len(chunks)}")
 
-    # Concatenate and save
-    final_audio = np.concatenate(all_audio)
-    sf.write(output, final_audio, synth.sample_rate)
-
     # Print results
-    duration_seconds = len(final_audio) / synth.sample_rate
-    hours = int(duration_seconds // 3600)
-    minutes = int((duration_seconds % 3600) // 60)
-    seconds = int(duration_seconds % 60)
-    duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    duration_str = format_duration(writer.duration_seconds)
 
     console.print()
     console.print("[bold green]Conversion complete![/bold green]")
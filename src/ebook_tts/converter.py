@@ -40,6 +40,7 @@ class PDFToAudiobook:
         dictionary_path: Optional[str] = None,
         base_dictionary_path: Optional[str] = None,
         checkpoint_manager: Optional["CheckpointManager"] = None,
+        synthesizer=None,
     ):
         """
         Initialize the converter.
@@ -55,6 +56,7 @@ class PDFToAudiobook:
             dictionary_path: Path to YAML pronunciation dictionary
             base_dictionary_path: Optional base dictionary to merge with
             checkpoint_manager: Optional checkpoint manager for resumable conversion
+            synthesizer: Optional pre-built synthesizer (overrides mock_tts and device)
         """
         self.progress_callback = progress_callback
         self.paragraph_pause = paragraph_pause
@@ -74,7 +76,9 @@ class PDFToAudiobook:
         self.chunker = TextChunker(max_chars=chunk_size)
 
         # Initialize synthesizer
-        if mock_tts:
+        if synthesizer is not None:
+            self.synthesizer = synthesizer
+        elif mock_tts:
             self.synthesizer = MockSynthesizer()
         else:
             self.synthesizer = KokoroSynthesizer(
@@ -183,6 +187,8 @@ class PDFToAudiobook:
                 # Resume from existing checkpoint
                 checkpoint_state = self.checkpoint_manager.load_state()
                 completed_chunks = set(checkpoint_state.completed_chunks)
+                # Compact the completed-chunk log into state.json
+                self.checkpoint_manager.save_state(checkpoint_state)
             else:
                 # Create new checkpoint
                 chapters_data = [
@@ -261,7 +267,7 @@ class PDFToAudiobook:
                     chunk_audio = np.concatenate(audio_parts)
                     self.checkpoint_manager.save_chunk(i, chunk_audio)
                     checkpoint_state.completed_chunks.append(i)
-                    self.checkpoint_manager.save_state(checkpoint_state)
+                    self.checkpoint_manager.mark_completed(i)
 
                 # Add paragraph pause if needed
                 if chunk.paragraph_break_after:
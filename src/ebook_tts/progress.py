@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import Callable, Literal, Optional
 
+from .utils import format_duration
+
 
 @dataclass
 class ProgressUpdate:
@@ -97,7 +99,4 @@ class ConversionResult:
     @property
     def duration_formatted(self) -> str:
         """Return duration as HH:MM:SS format."""
-        hours = int(self.duration_seconds // 3600)
-        minutes = int((self.duration_seconds % 3600) // 60)
-        seconds = int(self.duration_seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return format_duration(self.duration_seconds)
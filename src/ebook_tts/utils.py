@@ -84,6 +84,13 @@ def format_time(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
 
+def format_duration(seconds: float) -> str:
+    """Format a duration as HH:MM:SS, truncating partial seconds."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitize a string for use as a filename."""
     # Remove or replace invalid characters
@@ -153,22 +160,24 @@ def generate_silence(duration_seconds: float, sample_rate: int = 24000) -> "np.n
     return np.zeros(samples, dtype=np.float32)
 
 
-def hash_file(path: str, chunk_size: int = 65536) -> str:
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
     """
-    Compute SHA256 hash of file contents.
+    Compute a BLAKE2b fingerprint of file contents.
 
     Args:
         path: Path to the file to hash
-        chunk_size: Size of chunks to read (default 64KB)
+        chunk_size: Size of chunks to read (default 1MB)
 
     Returns:
-        Hexadecimal SHA256 hash string
+        Hexadecimal 256-bit BLAKE2b hash string
     """
-    sha256 = hashlib.sha256()
-    with open(path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    digest = hashlib.blake2b(digest_size=32)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.hexdigest()
 
 
 def hash_settings(settings: dict) -> str:
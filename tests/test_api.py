@@ -0,0 +1,318 @@
+"""Tests for the REST API."""
+
+import os
+import socket
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("alembic")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from passlib.context import CryptContext  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+# The API's settings and database engine are built when ebook_tts.api is
+# first imported, so its modules are only imported once api_env has
+# pointed them at a throwaway database.
+
+
+@pytest.fixture(scope="module", autouse=True)
+def api_env(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Configure the API for a migrated scratch database for this module only."""
+    data_dir = tmp_path_factory.mktemp("api")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("EBOOK_TTS_DATABASE_URL", f"sqlite:///{data_dir / 'test.db'}")
+        mp.setenv("EBOOK_TTS_USE_LOCAL_STORAGE", "true")
+        mp.setenv("EBOOK_TTS_LOCAL_STORAGE_PATH", str(data_dir / "uploads"))
+        mp.setenv("EBOOK_TTS_WARMUP_MODEL", "false")
+        mp.setenv("EBOOK_TTS_JWT_SECRET_KEY", "test-secret-key-that-is-at-least-32-bytes")
+
+        from ebook_tts.api.config import get_settings
+        from ebook_tts.api.db.database import engine
+
+        command.upgrade(Config(str(Path(__file__).parent.parent / "alembic.ini")), "head")
+        try:
+            yield
+        finally:
+            engine.dispose()
+            get_settings.cache_clear()
+
+
+def _add_job(user_id: str, **values) -> str:
+    """Insert a job row directly and return its ID."""
+    from ebook_tts.api.db.database import SessionLocal
+    from ebook_tts.api.db.models import Job, uuid7
+
+    job_id = uuid7()
+    db = SessionLocal()
+    try:
+        db.add(Job(
+            id=job_id,
+            user_id=user_id,
+            input_filename="book.epub",
+            input_s3_key=f"uploads/{user_id}/book.epub",
+            **values,
+        ))
+        db.commit()
+    finally:
+        db.close()
+    return job_id
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create an API client without running the startup lifespan."""
+    from ebook_tts.api import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth(client: TestClient, request: pytest.FixtureRequest) -> dict:
+    """Register a fresh user and return its id and auth headers."""
+    email = f"{request.node.name}@example.com"
+    credentials = {"email": email, "password": "correct horse battery"}
+    registered = client.post("/api/v1/auth/register", json=credentials)
+    assert registered.status_code == 201, registered.text
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {
+        "user": registered.json(),
+        "headers": {"Authorization": f"Bearer {token}"},
+    }
+
+
+class TestAuth:
+    """Tests for the auth endpoints."""
+
+    def test_register_matches_me(self, client: TestClient, auth: dict):
+        """Register returns the same user representation as /me."""
+        me = client.get("/api/v1/auth/me", headers=auth["headers"])
+        assert me.status_code == 200
+        assert me.json() == auth["user"]
+
+    def test_register_only_inserts(self, client: TestClient):
+        """Register writes the new user with a single INSERT."""
+        from ebook_tts.api.db.database import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                "/api/v1/auth/register",
+                json={"email": "one-insert@example.com", "password": "correct horse battery"},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 201
+        assert "UPDATE" not in statements
+        assert statements.count("INSERT") == 1
+
+    def test_login_rehash_invalidates_cached_user(self, client: TestClient, auth: dict):
+        """A login that upgrades the password hash drops the cached user."""
+        from ebook_tts.api.db.database import SessionLocal
+        from ebook_tts.api.db.models import User
+        from ebook_tts.api.dependencies import _user_cache
+
+        user_id = auth["user"]["id"]
+        db = SessionLocal()
+        try:
+            db.get(User, user_id).hashed_password = CryptContext(schemes=["bcrypt"]).hash(
+                "correct horse battery"
+            )
+            db.commit()
+        finally:
+            db.close()
+        client.get("/api/v1/auth/me", headers=auth["headers"])
+        assert user_id in _user_cache
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": auth["user"]["email"], "password": "correct horse battery"},
+        )
+
+        assert response.status_code == 200
+        assert user_id not in _user_cache
+
+
+class TestListJobs:
+    """Tests for paging through the job list."""
+
+    def test_after_pages_through_created_at_ties(self, client: TestClient, auth: dict):
+        """Keyset paging visits every job once when timestamps tie."""
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        job_ids = {
+            _add_job(auth["user"]["id"], created_at=created_at) for _ in range(5)
+        }
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/api/v1/convert/jobs", params=params, headers=auth["headers"])
+            assert response.status_code == 200
+            jobs = response.json()
+            if not jobs:
+                break
+            seen.extend(job["id"] for job in jobs)
+            params["after"] = jobs[-1]["id"]
+
+        assert len(seen) == len(job_ids)
+        assert set(seen) == job_ids
+
+    def test_after_unknown_cursor(self, client: TestClient, auth: dict):
+        """An unknown cursor is rejected instead of returning an empty page."""
+        response = client.get(
+            "/api/v1/convert/jobs",
+            params={"after": "no-such-job"},
+            headers=auth["headers"],
+        )
+        assert response.status_code == 400
+
+    def test_after_other_users_job(self, client: TestClient, auth: dict):
+        """Another user's job can't be used as a cursor."""
+        other = client.post(
+            "/api/v1/auth/register",
+            json={"email": "cursor-owner@example.com", "password": "correct horse battery"},
+        ).json()
+        job_id = _add_job(other["id"])
+
+        response = client.get(
+            "/api/v1/convert/jobs",
+            params={"after": job_id},
+            headers=auth["headers"],
+        )
+        assert response.status_code == 400
+
+
+class TestJobQueue:
+    """Tests for claiming jobs and recovering them at startup."""
+
+    def _status(self, job_id: str) -> tuple[str, float]:
+        """Read a job's status and progress."""
+        from ebook_tts.api.db.database import SessionLocal
+        from ebook_tts.api.db.models import Job
+
+        db = SessionLocal()
+        try:
+            job = db.get(Job, job_id)
+            return job.status, job.progress_percent
+        finally:
+            db.close()
+
+    def test_claim_is_exclusive(self, auth: dict):
+        """Only the first claim on a pending job succeeds."""
+        from ebook_tts.api.db.database import SessionLocal
+        from ebook_tts.api.services.job_service import JobService
+
+        job_id = _add_job(auth["user"]["id"])
+
+        db = SessionLocal()
+        try:
+            job_service = JobService(db)
+            assert job_service.claim(job_id, "host:1:first")
+            assert not job_service.claim(job_id, "host:2:second")
+        finally:
+            db.close()
+
+    def test_requeue_resets_jobs_of_exited_workers(self, auth: dict):
+        """Jobs left processing by a process that has exited are queued again."""
+        from ebook_tts.api.db.models import JobStatus
+        from ebook_tts.api.services.worker_service import JobQueue
+
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        job_id = _add_job(
+            auth["user"]["id"],
+            status=JobStatus.PROCESSING.value,
+            progress_percent=40.0,
+            worker_id=f"{socket.gethostname()}:{exited.pid}:dead",
+        )
+
+        job_queue = JobQueue()
+        job_queue.requeue_pending()
+
+        assert job_id in job_queue._queue.queue
+        assert self._status(job_id) == (JobStatus.PENDING.value, 0)
+
+    def test_requeue_keeps_jobs_of_live_workers(self, auth: dict):
+        """Jobs another running process is working on are left alone."""
+        from ebook_tts.api.db.models import JobStatus
+        from ebook_tts.api.services.worker_service import JobQueue
+
+        job_id = _add_job(
+            auth["user"]["id"],
+            status=JobStatus.PROCESSING.value,
+            progress_percent=40.0,
+            worker_id=f"{socket.gethostname()}:{os.getppid()}:live",
+        )
+
+        job_queue = JobQueue()
+        job_queue.requeue_pending()
+
+        assert job_id not in job_queue._queue.queue
+        assert self._status(job_id) == (JobStatus.PROCESSING.value, 40.0)
+
+
+class TestStorageService:
+    """Tests for the S3 storage caches."""
+
+    class _FakeS3:
+        """Minimal stand-in for the boto3 S3 client."""
+
+        def __init__(self):
+            self.signed = 0
+
+        def generate_presigned_url(self, operation, Params, ExpiresIn):
+            self.signed += 1
+            return f"https://s3.example.com/{Params['Key']}?sig={self.signed}"
+
+        def delete_object(self, Bucket, Key):
+            pass
+
+    def test_delete_file_evicts_download_urls(self):
+        """Deleting a file drops every cached download URL for it."""
+        from ebook_tts.api.config import Settings
+        from ebook_tts.api.services.storage_service import StorageService
+
+        storage = StorageService(Settings(
+            use_local_storage=False,
+            s3_endpoint_url="https://s3.example.com",
+            s3_access_key_id="key",
+            s3_secret_access_key="secret",
+        ))
+        storage._client = self._FakeS3()
+
+        plain = storage.get_download_url("outputs/a.mp3")
+        named = storage.get_download_url("outputs/a.mp3", "a.mp3")
+        other = storage.get_download_url("outputs/b.mp3")
+
+        storage.delete_file("outputs/a.mp3")
+
+        assert storage.get_download_url("outputs/a.mp3") != plain
+        assert storage.get_download_url("outputs/a.mp3", "a.mp3") != named
+        assert storage.get_download_url("outputs/b.mp3") == other
+
+    def test_download_local(self, client: TestClient, auth: dict):
+        """Files in local storage are served from their local path."""
+        from ebook_tts.api.services.storage_service import get_storage_service
+
+        key = f"outputs/{auth['user']['id']}/book.mp3"
+        path = get_storage_service().local_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"audio")
+
+        response = client.get(f"/api/v1/convert/download-local/{key}", headers=auth["headers"])
+        assert response.status_code == 200
+        assert response.content == b"audio"
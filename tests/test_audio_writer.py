@@ -1,9 +1,13 @@
 """Tests for audio writer functionality."""
 
+import re
+import shutil
+import subprocess
 from pathlib import Path
 
 import numpy as np
 import pytest
+import soundfile as sf
 
 from ebook_tts.audio_writer import SimpleAudioWriter, StreamingAudioWriter
 
@@ -24,6 +28,21 @@ class TestSimpleAudioWriter:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_writes_chunks_in_order(self, tmp_path: Path):
+        """Chunks end up in the file in the order they were written."""
+        output_path = tmp_path / "test.wav"
+
+        writer = SimpleAudioWriter(str(output_path), sample_rate=24000)
+        writer.write(np.full(100, 0.25, dtype=np.float32))
+        writer.write(np.full(50, -0.5, dtype=np.float64))
+        writer.finalize()
+
+        audio, _ = sf.read(str(output_path), dtype="float32")
+        assert len(audio) == 150
+        np.testing.assert_allclose(audio[:100], 0.25, atol=1e-4)
+        np.testing.assert_allclose(audio[100:], -0.5, atol=1e-4)
+        assert writer.duration_seconds == pytest.approx(150 / 24000)
+
     def test_duration_tracking(self, tmp_path: Path):
         """Track duration from written samples."""
         output_path = tmp_path / "test.wav"
@@ -50,6 +69,47 @@ class TestStreamingAudioWriter:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_writes_16bit_pcm(self, tmp_path: Path):
+        """Write 16-bit PCM, clipping out-of-range samples."""
+        output_path = tmp_path / "test.wav"
+
+        with StreamingAudioWriter(str(output_path), sample_rate=24000) as writer:
+            writer.write(np.array([0.5, 1.5, -2.0], dtype=np.float32))
+
+        assert sf.info(str(output_path)).subtype == "PCM_16"
+        audio, _ = sf.read(str(output_path), dtype="int16")
+        assert audio.tolist() == [16384, 32767, -32768]
+
+    def test_buffered_writes_keep_order(self, tmp_path: Path):
+        """Small and oversized chunks come out in order, none dropped."""
+        output_path = tmp_path / "test.wav"
+        rng = np.random.default_rng(0)
+        chunks = [rng.uniform(-1, 1, n).astype(np.float32) for n in (1000, 300000, 7, 150000)]
+        chunks += [rng.uniform(-1, 1, 5000).astype(np.float32) for _ in range(60)]
+
+        with StreamingAudioWriter(str(output_path), sample_rate=24000) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        audio, _ = sf.read(str(output_path), dtype="float32")
+        assert len(audio) == writer.duration_seconds * 24000
+        np.testing.assert_allclose(audio, np.concatenate(chunks), atol=1 / 32767)
+
+    def test_silence_between_chunks(self, tmp_path: Path):
+        """Silence longer than the write buffer lands between the chunks."""
+        output_path = tmp_path / "test.wav"
+
+        with StreamingAudioWriter(str(output_path), sample_rate=24000) as writer:
+            writer.write(np.full(100, 0.5, dtype=np.float32))
+            writer.write_silence(12.0)
+            writer.write(np.full(100, -0.5, dtype=np.float32))
+
+        audio, _ = sf.read(str(output_path), dtype="float32")
+        assert len(audio) == 100 + 12 * 24000 + 100
+        np.testing.assert_allclose(audio[:100], 0.5, atol=1e-4)
+        assert not audio[100:-100].any()
+        np.testing.assert_allclose(audio[-100:], -0.5, atol=1e-4)
+
     def test_write_multiple_chunks(self, tmp_path: Path):
         """Write multiple audio chunks."""
         output_path = tmp_path / "test.wav"
@@ -135,3 +195,41 @@ class TestAudioWriterOutput:
 
         assert output_path.exists()
         assert output_path.stat().st_size > 0
+
+
+def _read_chapters(path: Path) -> list[tuple[str, float, float]]:
+    """Read (title, start, end) chapter markers back out of a file."""
+    # ffmpeg prints the stored chapter times when probing its input. Its
+    # ffmetadata export would shift mp3 chapters by the encoder delay.
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", str(path)],
+        capture_output=True, text=True,
+    )
+    return [
+        (title, float(start), float(end))
+        for start, end, title in re.findall(
+            r"Chapter #\S+ start ([\d.]+), end ([\d.]+)\s+Metadata:\s+title\s+: (.*)",
+            result.stderr,
+        )
+    ]
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="FFmpeg not installed")
+class TestEncodedOutput:
+    """Tests for FFmpeg-encoded output with chapters."""
+
+    @pytest.mark.parametrize("extension", ["mp3", "m4b"])
+    def test_chapters_round_trip(self, tmp_path: Path, extension: str):
+        """Chapter markers survive encoding at the positions they were added."""
+        output_path = tmp_path / f"test.{extension}"
+
+        with StreamingAudioWriter(str(output_path), sample_rate=24000) as writer:
+            writer.add_chapter("Chapter 1")
+            writer.write(np.zeros(24000, dtype=np.float32))
+            writer.add_chapter("Chapter 2")
+            writer.write(np.zeros(48000, dtype=np.float32))
+
+        chapters = _read_chapters(output_path)
+        assert [title for title, _, _ in chapters] == ["Chapter 1", "Chapter 2"]
+        assert chapters[0][1:] == pytest.approx((0.0, 1.0), abs=0.01)
+        assert chapters[1][1:] == pytest.approx((1.0, 3.0), abs=0.01)
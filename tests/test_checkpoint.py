@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -157,19 +158,65 @@ class TestCheckpointManager:
         assert loaded.total_chunks == 50
         assert loaded.input_path == str(sample_input_file)
 
+    def test_completed_log_merged_on_load(
+        self, manager: CheckpointManager, sample_input_file: Path
+    ):
+        """Chunks marked completed are restored on load and compacted on save."""
+        state = manager.create_state(
+            input_path=str(sample_input_file),
+            output_path="/tmp/output.wav",
+            settings={},
+            total_chunks=10,
+            chapters=[],
+            sample_rate=24000,
+        )
+        state.completed_chunks = [0]
+        manager.save_state(state)
+
+        manager.mark_completed(1)
+        manager.mark_completed(0)
+        manager.mark_completed(2)
+        # Simulate a crash part-way through an append
+        with open(manager.completed_log, "ab") as f:
+            f.write(b"3")
+
+        loaded = manager.load_state()
+        assert loaded.completed_chunks == [0, 1, 2]
+
+        manager.save_state(loaded)
+        assert not manager.completed_log.exists()
+        assert manager.load_state().completed_chunks == [0, 1, 2]
+
+    def test_input_hash_cached_until_file_changes(
+        self, manager: CheckpointManager, sample_input_file: Path
+    ):
+        """The input hash is reused until the file's size or mtime changes."""
+        first = manager._cached_input_hash(str(sample_input_file))
+        assert manager.input_hash_file.exists()
+
+        with mock.patch("ebook_tts.checkpoint.hash_file") as hash_mock:
+            assert manager._cached_input_hash(str(sample_input_file)) == first
+            hash_mock.assert_not_called()
+
+        sample_input_file.write_bytes(b"different content")
+        assert manager._cached_input_hash(str(sample_input_file)) != first
+
     def test_save_and_load_chunk(self, manager: CheckpointManager):
         """Save and load audio chunk."""
         # Create checkpoint dir
         manager.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         manager.chunks_dir.mkdir(parents=True, exist_ok=True)
 
-        audio = np.random.randn(24000).astype(np.float32)
+        audio = np.random.uniform(-1, 1, 24000).astype(np.float32)
         manager.save_chunk(0, audio)
 
         loaded = manager.load_chunk(0)
 
         assert loaded is not None
-        assert np.allclose(audio, loaded)
+        assert loaded.dtype == np.float32
+        assert manager.chunk_path(0).stat().st_size == 2 * len(audio)
+        # 16-bit precision
+        assert np.allclose(audio, loaded, atol=1 / 32768)
 
     def test_load_missing_chunk_returns_none(self, manager: CheckpointManager):
         """Loading non-existent chunk returns None."""
@@ -180,9 +227,9 @@ class TestCheckpointManager:
 
     def test_chunk_path(self, manager: CheckpointManager):
         """Chunk path uses zero-padded index."""
-        assert manager.chunk_path(0) == manager.chunks_dir / "000000.npy"
-        assert manager.chunk_path(42) == manager.chunks_dir / "000042.npy"
-        assert manager.chunk_path(999999) == manager.chunks_dir / "999999.npy"
+        assert manager.chunk_path(0) == manager.chunks_dir / "000000.raw"
+        assert manager.chunk_path(42) == manager.chunks_dir / "000042.raw"
+        assert manager.chunk_path(999999) == manager.chunks_dir / "999999.raw"
 
     def test_verify_matching_checkpoint(
         self, manager: CheckpointManager, sample_input_file: Path
@@ -328,6 +375,32 @@ class TestCheckpointManager:
         assert 1 in reloaded.completed_chunks
         assert 2 not in reloaded.completed_chunks
 
+    def test_verify_drops_truncated_chunks(
+        self, manager: CheckpointManager, sample_input_file: Path
+    ):
+        """Verify treats empty or partially written chunk files as missing."""
+        settings = {"voice": "af_heart"}
+
+        state = manager.create_state(
+            input_path=str(sample_input_file),
+            output_path="/tmp/output.wav",
+            settings=settings,
+            total_chunks=10,
+            chapters=[],
+            sample_rate=24000,
+        )
+        state.completed_chunks = [0, 1, 2]
+        manager.save_state(state)
+
+        manager.save_chunk(0, np.zeros(100, dtype=np.float32))
+        manager.chunk_path(1).write_bytes(b"")
+        manager.chunk_path(2).write_bytes(b"\x00" * 3)
+
+        valid, msg = manager.verify(str(sample_input_file), settings)
+
+        assert valid is True
+        assert manager.load_state().completed_chunks == [0]
+
     def test_atomic_state_write(self, manager: CheckpointManager, sample_input_file: Path):
         """State file is written atomically."""
         state = manager.create_state(
@@ -344,7 +417,7 @@ class TestCheckpointManager:
         with open(manager.state_file) as f:
             data = json.load(f)
 
-        assert data["version"] == 1
+        assert data["version"] == CheckpointManager.VERSION
         assert data["total_chunks"] == 10
 
 
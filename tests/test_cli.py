@@ -84,6 +84,30 @@ class TestConvertCommand:
         assert "--dict" not in result.output or "Invalid" not in result.output
 
 
+class TestProgressCallback:
+    """Tests for the convert progress callback."""
+
+    def test_coalesces_chunk_updates(self):
+        """Small steps are dropped; stage, chapter and completion are not."""
+        from unittest import mock
+
+        from ebook_tts.cli import create_progress_callback
+        from ebook_tts.progress import ProgressUpdate
+
+        progress = mock.Mock()
+        callback = create_progress_callback(progress, task_id=1, min_interval=3600)
+
+        callback(ProgressUpdate(stage="synthesizing", percent=10.0, message="a"))
+        callback(ProgressUpdate(stage="synthesizing", percent=10.1, message="b"))
+        callback(ProgressUpdate(stage="synthesizing", percent=10.2, message="c", chapter="Two"))
+        callback(ProgressUpdate(stage="synthesizing", percent=10.8, message="d"))
+        callback(ProgressUpdate(stage="finalizing", percent=10.9, message="e"))
+        callback(ProgressUpdate(stage="finalizing", percent=100.0, message="f"))
+
+        messages = [c.kwargs["description"].split()[-1] for c in progress.update.call_args_list]
+        assert messages == ["a", "c", "d", "e", "f"]
+
+
 class TestTextToWavCommand:
     """Tests for the text-to-wav command."""
 
@@ -100,6 +124,77 @@ class TestTextToWavCommand:
         result = runner.invoke(cli, ["text-to-wav", "--input", str(text_path)])
         assert result.exit_code != 0
 
+    def test_synthesize_in_order_keeps_order(self):
+        """Concurrent synthesis yields audio in input order."""
+        import random
+        import time
+
+        from ebook_tts.cli import synthesize_in_order
+
+        class SlowSynth:
+            def synthesize(self, text, speed=1.0):
+                time.sleep(random.uniform(0, 0.01))
+                yield text
+
+        texts = [str(i) for i in range(30)]
+        results = list(synthesize_in_order(SlowSynth(), texts, speed=1.0, workers=4))
+
+        assert results == [[text] for text in texts]
+
+
+class TestConvertBatchCommand:
+    """Tests for the convert-batch command."""
+
+    def test_convert_batch_no_matches(self, runner: CliRunner, tmp_path: Path):
+        """An empty directory is reported, not treated as an error."""
+        result = runner.invoke(cli, ["convert-batch", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "No files matching" in result.output
+
+    def test_convert_batch_mock(self, runner: CliRunner, tmp_path: Path):
+        """Each matching file gets an audiobook; failures don't stop the rest."""
+        import fitz
+
+        for name in ("one", "two"):
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), "Hello world. " * 20)
+            doc.save(tmp_path / f"{name}.pdf")
+        (tmp_path / "broken.pdf").write_text("not a pdf")
+        out_dir = tmp_path / "out"
+
+        result = runner.invoke(
+            cli,
+            ["convert-batch", str(tmp_path), "-o", str(out_dir), "--mock", "-w", "1"],
+        )
+
+        assert result.exit_code == 1
+        assert sorted(p.name for p in out_dir.iterdir()) == ["one.wav", "two.wav"]
+        assert "1 of 3 conversion(s) failed" in result.output
+
+    def test_convert_batch_keeps_same_named_books_apart(
+        self, runner: CliRunner, tmp_path: Path
+    ):
+        """Books sharing a name get distinct outputs instead of overwriting."""
+        import fitz
+
+        for path in (tmp_path / "book.pdf", tmp_path / "sub" / "book.pdf"):
+            path.parent.mkdir(exist_ok=True)
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), "Hello world. " * 20)
+            doc.save(path)
+        (tmp_path / "book.epub").write_text("not an epub")
+        out_dir = tmp_path / "out"
+
+        result = runner.invoke(
+            cli,
+            ["convert-batch", str(tmp_path), "-o", str(out_dir),
+             "--pattern", "**/book.*", "--mock", "-w", "1"],
+        )
+
+        assert "1 of 3 conversion(s) failed" in result.output
+        assert (out_dir / "book.pdf.wav").exists()
+        assert (out_dir / "sub" / "book.wav").exists()
+
 
 class TestChaptersCommand:
     """Tests for the chapters command."""
@@ -119,3 +119,76 @@ class TestChapterDetector:
 
         assert len(chapters) >= 2
         assert "Introduction" in chapters[0].title or "Chapter 1" in chapters[0].title
+
+    def test_pattern_headings_match_whole_lines(self):
+        """Headings are matched line by line, with titles and line offsets."""
+        from ebook_tts.chapter_detector import ChapterDetector
+
+        detector = ChapterDetector()
+        text = (
+            "  CHAPTER IV - The End  \n"
+            "Chapter 5\n"
+            "The heading's next line is not its subtitle.\n"
+            "See Chapter 6 for details.\n"
+            "Prólogo:   \n"
+        )
+
+        chapters = detector._from_patterns(text)
+
+        assert [(ch.title, ch.start_char) for ch in chapters] == [
+            ("Chapter IV: The End", 0),
+            ("Chapter 5", 25),
+            ("Prólogo", 107),
+        ]
+
+    def test_toc_entries_resolve_to_page_offsets(self):
+        """TOC entries start at their page, or the last page before it."""
+        from ebook_tts.chapter_detector import ChapterDetector
+        from ebook_tts.progress import PageContent, TOCEntry
+
+        detector = ChapterDetector()
+        pages = [PageContent(page_num=n, text="", char_offset=n * 100) for n in (1, 2, 4, 5)]
+        toc = [
+            TOCEntry(level=1, title="Front", page_num=0),
+            TOCEntry(level=1, title="One", page_num=2),
+            TOCEntry(level=1, title="Two", page_num=3),
+            TOCEntry(level=1, title="Three", page_num=9),
+        ]
+
+        chapters = detector._from_toc(toc, pages)
+
+        assert [ch.start_char for ch in chapters] == [0, 200, 200, 500]
+
+    def test_short_chapters_are_merged_into_previous(self):
+        """Dropped false positives extend the preceding chapter's range."""
+        from ebook_tts.chapter_detector import Chapter, ChapterDetector
+
+        detector = ChapterDetector()
+        detector.min_chapter_length = 100
+        chapters = [
+            Chapter(title=title, start_char=start, start_page=0)
+            for title, start in [("One", 0), ("Stray", 150), ("Two", 160), ("Three", 400)]
+        ]
+
+        result = detector._finalize_chapters(chapters, 450)
+
+        assert [(ch.title, ch.start_char, ch.end_char) for ch in result] == [
+            ("One", 0, 160),
+            ("Two", 160, 450),
+        ]
+
+    def test_index_by_number(self):
+        """Chapters are indexed by their arabic or roman number."""
+        from ebook_tts.chapter_detector import Chapter, ChapterDetector
+
+        detector = ChapterDetector()
+        chapters = [
+            Chapter(title=title, start_char=0, start_page=0)
+            for title in ["Prologue", "Chapter 1", "Chapter II", "Chapter 2: Again"]
+        ]
+
+        index = detector.index_by_number(chapters)
+
+        assert {n: ch.title for n, ch in index.items()} == {1: "Chapter 1", 2: "Chapter II"}
+        assert detector.find_chapter_by_number(chapters, 2).title == "Chapter II"
+        assert detector.find_chapter_by_number(chapters, 3) is None
@@ -5,6 +5,7 @@ import pytest
 from ebook_tts.utils import (
     detect_language,
     estimate_audio_duration,
+    format_duration,
     format_time,
     generate_silence,
     get_output_format,
@@ -83,6 +84,22 @@ class TestFormatTime:
         assert format_time(0.0) == "00:00:00.000"
 
 
+class TestFormatDuration:
+    """Tests for duration formatting."""
+
+    def test_format_duration(self):
+        """Format hours, minutes and whole seconds."""
+        assert format_duration(3661.9) == "01:01:01"
+
+    def test_format_duration_just_under_hour(self):
+        """Partial seconds never round up into an extra minute."""
+        assert format_duration(3599.9999) == "00:59:59"
+
+    def test_format_duration_zero(self):
+        """Format zero."""
+        assert format_duration(0.0) == "00:00:00"
+
+
 class TestSanitizeFilename:
     """Tests for filename sanitization."""
 